@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from asyncio import StreamReader, StreamWriter
+from collections.abc import Iterable
 from contextlib import suppress
 import io
 import logging
@@ -44,6 +45,11 @@ class WriterAdapter(ABC):
         """Write some data to the protocol layer."""
         raise NotImplementedError
 
+    def writelines(self, data: Iterable[bytes | bytearray]) -> None:
+        """Write several buffers to the protocol layer, one after the other."""
+        for chunk in data:
+            self.write(chunk)
+
     @abstractmethod
     async def drain(self) -> None:
         """Let the write buffer of the underlying transport a chance to be flushed."""
@@ -74,6 +80,8 @@ class WebSocketsReader(ReaderAdapter):
     def __init__(self, protocol: Connection) -> None:
         self._protocol = protocol
         self._stream = io.BytesIO(b"")
+        # size of the bytes behind _stream; exporting its buffer to measure it would copy them
+        self._stream_size = 0
 
     async def read(self, n: int = -1) -> bytes:
         await self._feed_buffer(n)
@@ -84,16 +92,24 @@ class WebSocketsReader(ReaderAdapter):
 
         :param n: Optional; feed buffer until it contains at least n bytes. Defaults to 1.
         """
-        buffer = bytearray(self._stream.read())
+        available = self._stream_size - self._stream.tell()
+        if available >= n:
+            # enough bytes left from the previous WebSocket message, nothing to rebuild
+            return
+        chunks = [self._stream.read()]
         message: str | bytes | None = None
-        while len(buffer) < n:
+        while available < n:
             with suppress(ConnectionClosed):
                 message = await self._protocol.recv()
             if message is None:
                 break
             message = message.encode("utf-8") if isinstance(message, str) else message
-            buffer.extend(message)
-        self._stream = io.BytesIO(buffer)
+            chunks.append(message)
+            available += len(message)
+        # BytesIO shares an initial bytes value instead of copying it, unlike a bytearray
+        data = b"".join(chunks)
+        self._stream = io.BytesIO(data)
+        self._stream_size = len(data)
 
     def feed_eof(self) -> None:
         # NOTE: not implemented?!
@@ -114,6 +130,9 @@ class WebSocketsWriter(WriterAdapter):
         """Write some data to the protocol layer."""
         self._stream.write(data)
 
+    def writelines(self, data: Iterable[bytes | bytearray]) -> None:
+        self._stream.writelines(data)
+
     async def drain(self) -> None:
         """Let the write buffer of the underlying transport a chance to be flushed."""
         data = self._stream.getvalue()
@@ -132,6 +151,8 @@ class WebSocketsWriter(WriterAdapter):
         return cast("ssl.SSLObject", self._protocol.transport.get_extra_info("ssl_object"))
 
     async def close(self) -> None:
+        # send whatever was written since the last drain before closing
+        await self.drain()
         await self._protocol.close()
 
 
@@ -172,6 +193,11 @@ class StreamWriterAdapter(WriterAdapter):
         if not self.is_closed:
             self._writer.write(data)
 
+    def writelines(self, data: Iterable[bytes | bytearray]) -> None:
+        # transports that support it (3.12+ selector sockets) send the buffers with one sendmsg, without joining them
+        if not self.is_closed:
+            self._writer.writelines(data)
+
     async def drain(self) -> None:
         if not self.is_closed:
             await self._writer.drain()
@@ -837,17 +837,17 @@ class Broker:
         if data and topic_name is not None:
             # If retained flag set, store the message for further subscriptions
             self.logger.debug(f"Retaining message on topic {topic_name}")
-            self._retained_messages[topic_name] = RetainedApplicationMessage(source_session, topic_name, data, qos)
+            retained_message = RetainedApplicationMessage(source_session, topic_name, data, qos)
+            self._retained_messages[topic_name] = retained_message
 
             await self.plugins_manager.fire_event(BrokerEvents.RETAINED_MESSAGE,
                                                   client_id=None,
-                                                  retained_message=self._retained_messages[topic_name])
+                                                  retained_message=retained_message)
 
         # [MQTT-3.3.1-10]
-        elif topic_name in self._retained_messages:
+        elif (cleared_message := self._retained_messages.get(topic_name)) is not None:
             self.logger.debug(f"Clearing retained messages for topic '{topic_name}'")
 
-            cleared_message = self._retained_messages[topic_name]
             cleared_message.data = b""
 
             await self.plugins_manager.fire_event(BrokerEvents.RETAINED_MESSAGE,
@@ -878,10 +878,9 @@ class Broker:
             max_qos = qos
 
         qos = min(qos, max_qos)
-        if topic_filter not in self._subscriptions:
-            self._subscriptions[topic_filter] = []
-        if all(s.client_id != session.client_id for s, _ in self._subscriptions[topic_filter]):
-            self._subscriptions[topic_filter].append((session, qos))
+        subscriptions = self._subscriptions.setdefault(topic_filter, [])
+        if all(s.client_id != session.client_id for s, _ in subscriptions):
+            subscriptions.append((session, qos))
         else:
             self.logger.debug(f"Client {format_client_message(session=session)} has already subscribed to {topic_filter}")
         return qos
@@ -992,13 +991,17 @@ class Broker:
         """Process a single broadcast message."""
         broadcast = await self._broadcast_queue.get()
 
-        self.logger.debug(f"Processing broadcast message: {broadcast}")
+        # the broadcast repr includes the whole payload, so only build these messages when they will be emitted
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            self.logger.debug(f"Processing broadcast message: {broadcast}")
 
         for k_filter, subscriptions in self._subscriptions.items():
 
             # Skip all subscriptions which do not match the topic
             if not self._matches(broadcast["topic"], k_filter):
-                self.logger.debug(f"Topic '{broadcast['topic']}' does not match filter '{k_filter}'")
+                if debug_enabled:
+                    self.logger.debug(f"Topic '{broadcast['topic']}' does not match filter '{k_filter}'")
                 continue
 
             for target_session, sub_qos in subscriptions:
@@ -1110,10 +1113,13 @@ class Broker:
         publish_tasks = []
 
         topic_filter, qos = subscription
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         for topic, retained in self._retained_messages.items():
-            self.logger.debug(f"matching : {topic} {topic_filter}")
+            if debug_enabled:
+                self.logger.debug(f"matching : {topic} {topic_filter}")
             if self._matches(topic, topic_filter):
-                self.logger.debug(f"{topic} and {topic_filter} match")
+                if debug_enabled:
+                    self.logger.debug(f"{topic} and {topic_filter} match")
                 handler = self._get_handler(session)
                 if handler:
                     publish_tasks.append(
@@ -1,10 +1,15 @@
 import asyncio
 from decimal import ROUND_HALF_UP, Decimal
-from struct import pack, unpack
+from struct import Struct
 
 from amqtt.adapters import ReaderAdapter
 from amqtt.errors import NoDataError, ZeroLengthReadError
 
+# big endian two-byte integer used for string/data lengths and packet ids
+UINT16 = Struct("!H")
+# precompiled packers for the integer widths int_to_bytes supports
+_INT_STRUCTS = {1: Struct("!B"), 2: UINT16}
+
 
 def bytes_to_hex_str(data: bytes | bytearray) -> str:
     """Convert a sequence of bytes into its displayable hex representation, ie: 0x??????.
@@ -35,18 +40,12 @@ def int_to_bytes(int_value: int, length: int) -> bytes:
     :return: byte sequence
     :raises ValueError: if the length is unsupported
     """
-    # Map length to the appropriate format string
-    fmt_mapping = {
-        1: "!B",  # 1 byte, unsigned char
-        2: "!H",  # 2 bytes, unsigned short
-    }
-
-    fmt = fmt_mapping.get(length)
-    if not fmt:
+    packer = _INT_STRUCTS.get(length)
+    if packer is None:
         msg = "Unsupported length for int to bytes conversion. Only lengths 1 or 2 are allowed."
         raise ValueError(msg)
 
-    return pack(fmt, int_value)
+    return packer.pack(int_value)
 
 
 async def read_or_raise(reader: ReaderAdapter | asyncio.StreamReader, n: int = -1) -> bytes:
@@ -76,7 +75,7 @@ async def decode_string(reader: ReaderAdapter | asyncio.StreamReader) -> str:
     length_bytes = await read_or_raise(reader, 2)
     if len(length_bytes) < 1:
         raise ZeroLengthReadError
-    str_length = unpack("!H", length_bytes)[0]
+    str_length: int = UINT16.unpack(length_bytes)[0]
     if str_length:
         byte_str = await read_or_raise(reader, str_length)
         try:
@@ -96,10 +95,41 @@ async def decode_data_with_length(reader: ReaderAdapter | asyncio.StreamReader)
     length_bytes = await read_or_raise(reader, 2)
     if len(length_bytes) < 1:
         raise ZeroLengthReadError
-    bytes_length = unpack("!H", length_bytes)[0]
+    bytes_length: int = UINT16.unpack(length_bytes)[0]
     return await read_or_raise(reader, bytes_length)
 
 
+def decode_data_with_length_from(buffer: bytes | memoryview, offset: int = 0) -> tuple[memoryview, int]:
+    """Read data prefixed with 2 bytes length from an in-memory buffer.
+
+    :param buffer: buffer holding an already received packet
+    :param offset: position of the length prefix in the buffer
+    :return: data (without length) and the offset following it.
+    """
+    if len(buffer) < offset + 2:
+        msg = "No more data"
+        raise NoDataError(msg)
+    end = offset + 2 + ((buffer[offset] << 8) | buffer[offset + 1])
+    if len(buffer) < end:
+        msg = "No more data"
+        raise NoDataError(msg)
+    return memoryview(buffer)[offset + 2:end], end
+
+
+def decode_string_from(buffer: bytes | memoryview, offset: int = 0) -> tuple[str, int]:
+    """Read a string from an in-memory buffer and decode it according to MQTT string specification.
+
+    :param buffer: buffer holding an already received packet
+    :param offset: position of the string's length prefix in the buffer
+    :return: string and the offset following it.
+    """
+    data, offset = decode_data_with_length_from(buffer, offset)
+    try:
+        return str(data, encoding="utf-8"), offset
+    except UnicodeDecodeError:
+        return str(data.tobytes()), offset
+
+
 def encode_string(string: str) -> bytes:
     """Encode a string with its length as prefix.
 
@@ -107,8 +137,18 @@ def encode_string(string: str) -> bytes:
     :return: string with length prefix.
     """
     data = string.encode(encoding="utf-8")
-    data_length = len(data)
-    return int_to_bytes(data_length, 2) + data
+    return UINT16.pack(len(data)) + data
+
+
+def encode_string_into(buffer: bytearray, string: str) -> None:
+    """Append a string with its length as prefix to a buffer, without building an intermediate bytes object.
+
+    :param buffer: buffer to extend
+    :param string: string to encode
+    """
+    data = string.encode(encoding="utf-8")
+    buffer += UINT16.pack(len(data))
+    buffer += data
 
 
 def encode_data_with_length(data: bytes | bytearray) -> bytes:
@@ -117,8 +157,7 @@ def encode_data_with_length(data: bytes | bytearray) -> bytes:
     :param data: data to encode
     :return: data with length prefix.
     """
-    data_length = len(data)
-    return int_to_bytes(data_length, 2) + data
+    return UINT16.pack(len(data)) + data
 
 
 async def decode_packet_id(reader: ReaderAdapter | asyncio.StreamReader) -> int:
@@ -127,10 +166,8 @@ async def decode_packet_id(reader: ReaderAdapter | asyncio.StreamReader) -> int:
     :param reader: Stream reader
     :return: Packet ID.
     """
-    packet_id_bytes = await read_or_raise(reader, 2)
-    packet_id = unpack("!H", packet_id_bytes)
-    packet: int = packet_id[0]
-    return packet
+    packet_id: int = UINT16.unpack(await read_or_raise(reader, 2))[0]
+    return packet_id
 
 
 def int_to_bytes_str(value: int) -> bytes:
@@ -10,6 +10,7 @@ except ImportError:
     class StrEnum(str, Enum):  # type: ignore[no-redef]
         pass
 
+from collections import ChainMap
 from collections.abc import Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
@@ -55,6 +56,8 @@ class ListenerType(StrEnum):
 class Dictable:
     """Add dictionary methods to a dataclass."""
 
+    __slots__ = ()
+
     def __getitem__(self, key: str) -> Any:
         """Allow dict-style `[]` access to a dataclass."""
         return self.get(key)
@@ -92,7 +95,7 @@ class Dictable:
         raise ValueError(msg)
 
 
-@dataclass
+@dataclass(slots=True)
 class ListenerConfig(Dictable):
     """Structured configuration for a broker's listeners."""
 
@@ -157,7 +160,7 @@ def default_broker_plugins() -> dict[str, Any]:
     }
 
 
-@dataclass
+@dataclass(slots=True)
 class BrokerConfig(Dictable):
     """Structured configuration for a broker. Can be passed directly to `amqtt.broker.Broker` or created from a dictionary."""
 
@@ -201,14 +204,9 @@ class BrokerConfig(Dictable):
             listener.apply(default_listener)
 
         if isinstance(self.plugins, list):
-            _plugins: dict[str, Any] = {}
-            for plugin in self.plugins:
-                # in case a plugin in a yaml file is listed without config map
-                if isinstance(plugin, str):
-                    _plugins |= {plugin: {}}
-                    continue
-                _plugins |= plugin
-            self.plugins = _plugins
+            # in case a plugin in a yaml file is listed without config map; later entries take precedence
+            self.plugins = dict(ChainMap(*({plugin: {}} if isinstance(plugin, str) else plugin
+                                           for plugin in reversed(self.plugins))))
 
     @classmethod
     def from_dict(cls, d: dict[str, Any] | None) -> "BrokerConfig":
@@ -255,7 +253,7 @@ class ConnectionConfig(Dictable):
     keyfile: str | Path | None = None
     """Full path to file in PEM format containing the client's private key associated with the certfile."""
 
-    def __post__init__(self) -> None:
+    def __post_init__(self) -> None:
         """Check config for errors and transform fields for easier use."""
         if (self.certfile is None) ^ (self.keyfile is None):
             msg = "If specifying the 'certfile' or 'keyfile', both are required."
@@ -278,7 +276,7 @@ class TopicConfig(Dictable):
     retain: bool = False
     """Determines if the message should be retained by the topic it was published."""
 
-    def __post__init__(self) -> None:
+    def __post_init__(self) -> None:
         """Check config for errors and transform fields for easier use."""
         if self.qos is not None and (self.qos < QOS_0 or self.qos > QOS_2):
             msg = "Topic config: default QoS must be 0, 1 or 2."
@@ -298,7 +296,7 @@ class WillConfig(Dictable):
     retain: bool | None = False
     """Determines if the message should be retained by the topic it was published."""
 
-    def __post__init__(self) -> None:
+    def __post_init__(self) -> None:
         """Check config for errors and transform fields for easier use."""
         if self.qos is not None and (self.qos < QOS_0 or self.qos > QOS_2):
             msg = "Will config: default QoS must be 0, 1 or 2."
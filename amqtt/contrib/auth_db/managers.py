@@ -1,8 +1,11 @@
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator
+from enum import Enum, auto
 import logging
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import Insert, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from amqtt.contexts import Action
 from amqtt.contrib.auth_db.models import AllowedTopic, Base, TopicAuth, UserAuth
@@ -11,17 +14,28 @@ from amqtt.errors import MQTTError
 logger = logging.getLogger(__name__)
 
 
+class TopicRemoval(Enum):
+    """Outcome of `TopicManager.try_remove_allowed_topic`."""
+
+    NO_CLIENT = auto()
+    NOT_PRESENT = auto()
+    REMOVED = auto()
+
+
 class UserManager:
     """Interface to create, retrieve, update, validate, and delete users.
 
     Hashes passwords using `passlib.context.CryptContext`.
 
+    Accepts either a SQLAlchemy connection string or an existing `AsyncEngine`, so that
+    multiple managers can share a single connection pool.
+
     ??? warning "Implementation does not include any password validation."
         Use NIST or other password guidelines when calling functions that set or update passwords.
     """
 
-    def __init__(self, connection: str) -> None:
-        self._engine = create_async_engine(connection)
+    def __init__(self, connection: str | AsyncEngine) -> None:
+        self._engine = create_async_engine(connection) if isinstance(connection, str) else connection
         self._db_session_maker = async_sessionmaker(self._engine, expire_on_commit=False)
 
     async def db_sync(self) -> None:
@@ -116,9 +130,14 @@ class UserManager:
 
 
 class TopicManager:
+    """Interface to create, retrieve, update, and delete allowed topics for clients.
+
+    Accepts either a SQLAlchemy connection string or an existing `AsyncEngine`, so that
+    multiple managers can share a single connection pool.
+    """
 
-    def __init__(self, connection: str) -> None:
-        self._engine = create_async_engine(connection)
+    def __init__(self, connection: str | AsyncEngine) -> None:
+        self._engine = create_async_engine(connection) if isinstance(connection, str) else connection
         self._db_session_maker = async_sessionmaker(self._engine, expire_on_commit=False)
 
     async def db_sync(self) -> None:
@@ -141,6 +160,33 @@ class TopicManager:
     def _field_name(action: Action) -> str:
         return f"{action}_acl"
 
+    def _insert_topic_auth_if_missing(self, username: str) -> Insert | None:
+        """Build an INSERT of an empty topic auth that is a no-op when the username already exists.
+
+        Returns `None` for dialects without an insert-or-ignore form.
+        """
+        dialect = self._engine.dialect.name
+        if dialect == "sqlite":
+            return sqlite.insert(TopicAuth).values(username=username).on_conflict_do_nothing(index_elements=["username"])
+        if dialect == "postgresql":
+            return postgresql.insert(TopicAuth).values(username=username).on_conflict_do_nothing(index_elements=["username"])
+        if dialect in ("mysql", "mariadb"):
+            return insert(TopicAuth).values(username=username).prefix_with("IGNORE")
+        return None
+
+    async def _lock_topic_auth(self, db_session: AsyncSession, username: str) -> TopicAuth | None:
+        """Retrieve the topic auth by username, locked against concurrent updates until the transaction ends."""
+        if self._engine.dialect.name == "sqlite":
+            # SQLite ignores FOR UPDATE; a no-op update takes the database write lock before the read instead
+            await db_session.execute(
+                update(TopicAuth)
+                .where(TopicAuth.username == username)
+                .values(username=TopicAuth.username)
+                .execution_options(synchronize_session=False)
+            )
+        stmt = select(TopicAuth).filter(TopicAuth.username == username).with_for_update()
+        return await db_session.scalar(stmt)
+
     async def create_topic_auth(self, username: str) -> TopicAuth | None:
         """Create a new user."""
         async with self._db_session_maker() as db_session, db_session.begin():
@@ -176,6 +222,13 @@ class TopicManager:
                 raise MQTTError(msg)
             return topics
 
+    async def iter_topic_auths(self) -> AsyncIterator[TopicAuth]:
+        """Stream all authorized clients (ordered by username) without loading the full result set into memory."""
+        async with self._db_session_maker() as db_session, db_session.begin():
+            stmt = select(TopicAuth).order_by(TopicAuth.username)
+            async for topic_auth in await db_session.stream_scalars(stmt):
+                yield topic_auth
+
     async def add_allowed_topic(self, username: str, topic: str, action: Action) -> list[AllowedTopic] | None:
         """Add allowed topic from action for user."""
         if action == Action.PUBLISH and topic.startswith("$"):
@@ -192,6 +245,45 @@ class TopicManager:
             await db_session.flush()
             return updated_list
 
+    async def upsert_allowed_topic(self, username: str, topic: str, action: Action) -> list[AllowedTopic]:
+        """Add allowed topic from action for user, creating the user's topic auth if it doesn't exist.
+
+        The topic auth is created with an insert-or-ignore and then locked while the topic is appended,
+        so concurrent calls for a new username neither fail on the unique username nor lose an update.
+        """
+        if action == Action.PUBLISH and topic.startswith("$"):
+            msg = "MQTT does not allow clients to publish to $ topics."
+            raise MQTTError(msg)
+
+        async with self._db_session_maker() as db_session, db_session.begin():
+            insert_stmt = self._insert_topic_auth_if_missing(username)
+            if insert_stmt is not None:
+                await db_session.execute(insert_stmt)
+            else:
+                try:
+                    async with db_session.begin_nested():
+                        await db_session.execute(insert(TopicAuth).values(username=username))
+                except IntegrityError:
+                    # another client created the topic auth first
+                    pass
+
+            topic_auth = await self._lock_topic_auth(db_session, username)
+            if not topic_auth:
+                msg = f"Username '{username}' doesn't exist."
+                raise MQTTError(msg)
+
+            topic_list = topic_auth.get_topic_list(action)
+            if AllowedTopic(topic) in topic_list:
+                msg = f"Topic '{topic}' already exists for '{action}'."
+                logger.debug(msg)
+                raise MQTTError(msg)
+
+            updated_list = [*topic_list, AllowedTopic(topic)]
+            setattr(topic_auth, self._field_name(action), updated_list)
+            await db_session.commit()
+            await db_session.flush()
+            return updated_list
+
     async def remove_allowed_topic(self, username: str, topic: str, action: Action) -> list[AllowedTopic] | None:
         """Remove topic from action for user."""
         async with self._db_session_maker() as db_session, db_session.begin():
@@ -209,3 +301,23 @@ class TopicManager:
             await db_session.commit()
             await db_session.flush()
             return updated_list
+
+    async def try_remove_allowed_topic(self, username: str, topic: str, action: Action) -> TopicRemoval:
+        """Remove topic from action for user, reporting the outcome instead of raising.
+
+        The topic auth is locked while the topic is removed, so a concurrent change to the same ACL isn't lost.
+        """
+        async with self._db_session_maker() as db_session, db_session.begin():
+            topic_auth = await self._lock_topic_auth(db_session, username)
+            if not topic_auth:
+                return TopicRemoval.NO_CLIENT
+
+            topic_list = topic_auth.get_topic_list(action)
+            updated_list = [allowed_topic for allowed_topic in topic_list if allowed_topic != AllowedTopic(topic)]
+            if len(updated_list) == len(topic_list):
+                return TopicRemoval.NOT_PRESENT
+
+            setattr(topic_auth, self._field_name(action), updated_list)
+            await db_session.commit()
+            await db_session.flush()
+            return TopicRemoval.REMOVED
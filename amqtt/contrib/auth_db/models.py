@@ -1,7 +1,7 @@
 from collections.abc import Sequence
 from dataclasses import dataclass
 import logging
-from typing import ClassVar, Union, cast
+from typing import ClassVar, cast
 from typing_extensions import Self
 import warnings
 
@@ -26,7 +26,7 @@ matcher = TopicMatcher()
 class AllowedTopic:
     topic: str
 
-    def __contains__(self, item: Union[str, "AllowedTopic"]) -> bool:
+    def __contains__(self, item: "str | AllowedTopic") -> bool:
         """Determine `in`."""
         return self.__eq__(item)
 
@@ -27,8 +27,8 @@ class UserAuthDBPlugin(BaseAuthPlugin):
         # Initialize the singleton with the configured hash schemes.
         PasswordHasher(schemes=self.config.hash_schemes)
 
-        self._user_manager = UserManager(self.config.connection)
         self._engine = create_async_engine(f"{self.config.connection}")
+        self._user_manager = UserManager(self._engine)
 
     async def on_broker_pre_start(self) -> None:
         """Sync the schema (if configured)."""
@@ -66,8 +66,8 @@ class TopicAuthDBPlugin(BaseTopicPlugin):
     def __init__(self, context: BrokerContext) -> None:
         super().__init__(context)
 
-        self._topic_manager = TopicManager(self.config.connection)
         self._engine = create_async_engine(f"{self.config.connection}")
+        self._topic_manager = TopicManager(self._engine)
 
     async def on_broker_pre_start(self) -> None:
         """Sync the schema (if configured)."""
@@ -1,14 +1,17 @@
 import asyncio
-import contextlib
+from collections.abc import Coroutine
 import logging
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any
 
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 import typer
 
 from amqtt.contexts import Action
 from amqtt.contrib.auth_db import DBType, db_connection_str
-from amqtt.contrib.auth_db.managers import TopicManager, UserManager
+from amqtt.contrib.auth_db.managers import TopicManager, TopicRemoval, UserManager
 from amqtt.errors import MQTTError
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -42,7 +45,67 @@ def main(
         logger.error("DB access requires a username be provided.")
         raise typer.Exit(code=1)
 
-    ctx.obj = {"type": db_type, "username": db_username, "host": db_host, "port": db_port, "filename": db_filename}
+    ctx.obj = _CLIState(db_type, db_username, db_host, db_port, db_filename)
+    ctx.call_on_close(ctx.obj.close)
+
+
+class _CLIState:
+    """Database access shared by a CLI invocation, only connecting once a subcommand needs the database."""
+
+    def __init__(self, db_type: DBType, db_username: str, db_host: str, db_port: int, db_filename: str) -> None:
+        self.type = db_type
+        self.username = db_username
+        self.host = db_host
+        self.port = db_port
+        self.filename = db_filename
+        self._engine: AsyncEngine | None = None
+        # one loop serves the whole invocation (`asyncio.Runner` is not available on python 3.10)
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """Create the engine on first access and verify the database is reachable."""
+        if self._engine is None:
+            connect = db_connection_str(self.type, self.username, self.host, self.port, self.filename)
+            self._engine = create_async_engine(connect)
+            try:
+                self.loop.run_until_complete(_probe(self._engine))
+            except (SQLAlchemyError, OSError) as e:
+                logger.error(f"Could not connect to the database: {e}")
+                raise typer.Exit(code=1) from e
+        return self._engine
+
+    def run(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run a subcommand's coroutine once the engine is available."""
+        try:
+            _ = self.engine
+        except BaseException:
+            coro.close()
+            raise
+        self.loop.run_until_complete(coro)
+
+    def close(self) -> None:
+        """Release the engine's connections and close the shared loop once the invocation is complete."""
+        if self._loop is None:
+            return
+        try:
+            if self._engine is not None:
+                self._loop.run_until_complete(self._engine.dispose())
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+        finally:
+            self._loop.close()
+
+
+async def _probe(engine: AsyncEngine) -> None:
+    """Verify the database is reachable before a subcommand runs against it."""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
 
 
 @topic_app.command(name="sync")
@@ -52,14 +115,13 @@ def db_sync(ctx: typer.Context) -> None:
     Non-destructive if run multiple times. To clear the whole table, need to drop it manually.
     """
     async def run_sync() -> None:
-        connect = db_connection_str(ctx.obj["type"], ctx.obj["username"], ctx.obj["host"], ctx.obj["port"], ctx.obj["filename"])
-        mgr = UserManager(connect)
+        mgr = UserManager(ctx.obj.engine)
         try:
             await mgr.db_sync()
         except MQTTError as me:
             logger.critical("Could not sync schema on db.")
             raise typer.Exit(code=1) from me
-    asyncio.run(run_sync())
+    ctx.obj.run(run_sync())
     logger.info("Success: database synced.")
 
 
@@ -68,17 +130,16 @@ def list_clients(ctx: typer.Context) -> None:
     """List all Client IDs (in alphabetical order). Will also display the hashed passwords."""
 
     async def run_list() -> None:
-        connect = db_connection_str(ctx.obj["type"], ctx.obj["username"], ctx.obj["host"], ctx.obj["port"], ctx.obj["filename"])
-        mgr = TopicManager(connect)
+        mgr = TopicManager(ctx.obj.engine)
         user_count = 0
-        for user in await mgr.list_topic_auths():
+        async for user in mgr.iter_topic_auths():
             user_count += 1
             logger.info(user)
 
         if not user_count:
             logger.info("No client authorizations exist.")
 
-    asyncio.run(run_list())
+    ctx.obj.run(run_list())
 
 
 @topic_app.command(name="add")
@@ -90,28 +151,17 @@ def add_topic_allowance(
         ) -> None:
     """Create a new user with a client id and password (prompted)."""
     async def run_add() -> None:
+        mgr = TopicManager(ctx.obj.engine)
 
-        connect = db_connection_str(ctx.obj["type"], ctx.obj["username"], ctx.obj["host"], ctx.obj["port"],
-                                    ctx.obj["filename"])
-        mgr = TopicManager(connect)
-
-        with contextlib.suppress(MQTTError):
-            await mgr.create_topic_auth(client_id)
-
-        topic_auth = await mgr.get_topic_auth(client_id)
-        if not topic_auth:
-            logger.info(f"Topic auth doesn't exist for '{client_id}'")
-            raise typer.Exit(code=1)
-
-        if topic in [allowed_topic.topic for allowed_topic in topic_auth.get_topic_list(action)]:
-            logger.info(f"Topic '{topic}' already exists for '{action}'.")
-            raise typer.Exit(1)
-
-        await mgr.add_allowed_topic(client_id, topic, action)
+        try:
+            await mgr.upsert_allowed_topic(client_id, topic, action)
+        except MQTTError as me:
+            logger.info(f"{me}")
+            raise typer.Exit(1) from me
 
         logger.info(f"Success: topic '{topic}' added to {action} for '{client_id}'")
 
-    asyncio.run(run_add())
+    ctx.obj.run(run_add())
 
 
 @topic_app.command(name="rm")
@@ -122,29 +172,19 @@ def remove_topic_allowance(ctx: typer.Context,
                            ) -> None:
     """Remove a client from the authentication database."""
     async def run_remove() -> None:
-        connect = db_connection_str(ctx.obj["type"], ctx.obj["username"], ctx.obj["host"], ctx.obj["port"],
-                                    ctx.obj["filename"])
-        mgr = TopicManager(connect)
-
-        topic_auth = await mgr.get_topic_auth(client_id)
-
-        if not topic_auth:
-            logger.info(f"client '{client_id}' doesn't exist.")
-            raise typer.Exit(1)
-
-        if topic not in getattr(topic_auth, f"{action}_acl"):
-            logger.info(f"Error: topic '{topic}' not in the {action} allow list for {client_id}.")
-            raise typer.Exit(1)
-
-        try:
-            await mgr.remove_allowed_topic(client_id, topic, action)
-        except MQTTError as me:
-            logger.info(f"'Error: could not remove '{topic}' for client '{client_id}'.")
-            raise typer.Exit(1) from me
-
-        logger.info(f"Success: removed topic '{topic}' from {action} for '{client_id}'")
-
-    asyncio.run(run_remove())
+        mgr = TopicManager(ctx.obj.engine)
+
+        match await mgr.try_remove_allowed_topic(client_id, topic, action):
+            case TopicRemoval.NO_CLIENT:
+                logger.info(f"client '{client_id}' doesn't exist.")
+                raise typer.Exit(1)
+            case TopicRemoval.NOT_PRESENT:
+                logger.info(f"Error: topic '{topic}' not in the {action} allow list for {client_id}.")
+                raise typer.Exit(1)
+            case TopicRemoval.REMOVED:
+                logger.info(f"Success: removed topic '{topic}' from {action} for '{client_id}'")
+
+    ctx.obj.run(run_remove())
 
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@ from collections.abc import Sequence
 from dataclasses import asdict
 import logging
 import time
-from typing import Any, Optional
+from typing import Any
 import uuid
 
 from sqlalchemy import JSON, CheckConstraint, Integer, String, UniqueConstraint, desc, event, func, select
@@ -62,7 +62,7 @@ class Shadow(ShadowBase):
         self._state = asdict(value)
 
     @classmethod
-    async def latest_version(cls, session: AsyncSession, device_id: str, name: str) -> Optional["Shadow"]:
+    async def latest_version(cls, session: AsyncSession, device_id: str, name: str) -> "Shadow | None":
         """Get the latest version of the shadow associated with the device and name."""
         stmt = (
             select(cls).where(
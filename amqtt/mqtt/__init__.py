@@ -57,6 +57,9 @@ packet_dict: dict[int, type[_P]] = {
     DISCONNECT: DisconnectPacket,
 }
 
+# packet types are a 4-bit field, so the lookup can index a 16-slot tuple; reserved types stay None
+_packet_classes: tuple[type[_P] | None, ...] = tuple(packet_dict.get(packet_type) for packet_type in range(16))
+
 
 def packet_class(fixed_header: MQTTFixedHeader) -> type[_P]:
     """Return the packet class for a given fixed header.
@@ -68,11 +71,9 @@ def packet_class(fixed_header: MQTTFixedHeader) -> type[_P]:
     :rtype: type[MQTTPacket]
     :raises AMQTTError: If the packet type is not recognized.
     """
-    if fixed_header.packet_type not in packet_dict:
-        msg = f"Unexpected packet Type '{fixed_header.packet_type}'"
+    packet_type = fixed_header.packet_type
+    packet_cls = _packet_classes[packet_type] if 0 <= packet_type < len(_packet_classes) else None
+    if packet_cls is None:
+        msg = f"Unexpected packet Type '{packet_type}'"
         raise AMQTTError(msg)
-    try:
-        return packet_dict[fixed_header.packet_type]
-    except KeyError as e:
-        msg = f"Unexpected packet Type '{fixed_header.packet_type}'"
-        raise AMQTTError(msg) from e
+    return packet_cls
@@ -1,7 +1,7 @@
 from typing_extensions import Self
 
 from amqtt.adapters import ReaderAdapter
-from amqtt.codecs_amqtt import bytes_to_int, read_or_raise
+from amqtt.codecs_amqtt import read_or_raise
 from amqtt.errors import AMQTTError
 from amqtt.mqtt.packet import CONNACK, MQTTFixedHeader, MQTTPacket, MQTTPayload, MQTTVariableHeader
 
@@ -25,16 +25,12 @@ class ConnackVariableHeader(MQTTVariableHeader):
     async def from_stream(cls, reader: ReaderAdapter, _: MQTTFixedHeader | None) -> Self:
         data = await read_or_raise(reader, 2)
         session_parent = data[0] & 0x01
-        return_code = bytes_to_int(data[1])
+        return_code = data[1]
         return cls(session_parent, return_code)
 
-    def to_bytes(self) -> bytes | bytearray:
-        out = bytearray(2)
-        # Connect acknowledge flags
-        out[0] = 1 if self.session_parent else 0
-        # Return code
-        out[1] = self.return_code or 0
-        return out
+    def to_bytes(self) -> bytes:
+        # Connect acknowledge flags, return code
+        return bytes((1 if self.session_parent else 0, self.return_code or 0))
 
     def __repr__(self) -> str:
         """Return a string representation of the ConnackVariableHeader object."""
@@ -42,6 +38,8 @@ class ConnackVariableHeader(MQTTVariableHeader):
 
 
 class ConnackPacket(MQTTPacket[ConnackVariableHeader, MQTTPayload[MQTTVariableHeader], MQTTFixedHeader]):
+    __slots__ = ()
+
     VARIABLE_HEADER = ConnackVariableHeader
     PAYLOAD = MQTTPayload[MQTTVariableHeader]
 
@@ -1,31 +1,52 @@
 from asyncio import StreamReader
+from struct import Struct
+
+try:
+    from datetime import UTC, datetime
+except ImportError:
+    from datetime import datetime, timezone
+
+    UTC = timezone.utc
+
 from typing_extensions import Self
 
 from amqtt.adapters import ReaderAdapter
 from amqtt.codecs_amqtt import (
-    bytes_to_int,
-    decode_data_with_length,
-    decode_string,
-    encode_data_with_length,
+    UINT16,
+    decode_data_with_length_from,
+    decode_string_from,
     encode_string,
-    int_to_bytes,
     read_or_raise,
 )
 from amqtt.errors import AMQTTError, NoDataError
 from amqtt.mqtt.packet import CONNECT, MQTTFixedHeader, MQTTPacket, MQTTPayload, MQTTVariableHeader
 from amqtt.utils import gen_client_id
 
+# length-prefixed protocol name used by MQTT 3.1.1
+_MQTT_PROTO_NAME = b"\x00\x04MQTT"
+# protocol level, connect flags and keep-alive follow the protocol name
+_LEVEL_FLAGS_KEEP_ALIVE = Struct("!BBH")
+
+# connect flags
+_USERNAME_FLAG = 0x80
+_PASSWORD_FLAG = 0x40
+_WILL_RETAIN_FLAG = 0x20
+_WILL_FLAG = 0x04
+_WILL_QOS_MASK = 0x18
+_CLEAN_SESSION_FLAG = 0x02
+_RESERVED_FLAG = 0x01
+
 
 class ConnectVariableHeader(MQTTVariableHeader):
     __slots__ = ("flags", "keep_alive", "proto_level", "proto_name")
 
-    USERNAME_FLAG = 0x80
-    PASSWORD_FLAG = 0x40
-    WILL_RETAIN_FLAG = 0x20
-    WILL_FLAG = 0x04
-    WILL_QOS_MASK = 0x18
-    CLEAN_SESSION_FLAG = 0x02
-    RESERVED_FLAG = 0x01
+    USERNAME_FLAG = _USERNAME_FLAG
+    PASSWORD_FLAG = _PASSWORD_FLAG
+    WILL_RETAIN_FLAG = _WILL_RETAIN_FLAG
+    WILL_FLAG = _WILL_FLAG
+    WILL_QOS_MASK = _WILL_QOS_MASK
+    CLEAN_SESSION_FLAG = _CLEAN_SESSION_FLAG
+    RESERVED_FLAG = _RESERVED_FLAG
 
     def __init__(self, connect_flags: int = 0x00, keep_alive: int = 0, proto_name: str = "MQTT", proto_level: int = 0x04) -> None:
         super().__init__()
@@ -42,46 +63,37 @@ class ConnectVariableHeader(MQTTVariableHeader):
         )
 
     def _set_flag(self, val: bool, mask: int) -> None:
-        if val:
-            self.flags |= mask
-        else:
-            self.flags &= ~mask
+        self.flags = (self.flags & ~mask) | (bool(val) * mask)
 
     def _get_flag(self, mask: int) -> bool:
-        return bool(self.flags & mask)
+        return self.flags & mask != 0
 
     @classmethod
     async def from_stream(cls, reader: ReaderAdapter, _: MQTTFixedHeader) -> Self:
-        #  protocol name
-        protocol_name = await decode_string(reader)
-
-        # protocol level
-        protocol_level_byte = await read_or_raise(reader, 1)
-        protocol_level = bytes_to_int(protocol_level_byte)
-
-        # flags
-        flags_byte = await read_or_raise(reader, 1)
-        flags = bytes_to_int(flags_byte)
-
-        # keep-alive
-        keep_alive_byte = await read_or_raise(reader, 2)
-        keep_alive = bytes_to_int(keep_alive_byte)
-
-        return cls(flags, keep_alive, protocol_name, protocol_level)
-
-    def to_bytes(self) -> bytes | bytearray:
-        out = bytearray()
+        # the header size follows from the protocol name length, so read it whole and decode it with from_bytes
+        name_length = await read_or_raise(reader, 2)
+        rest = await read_or_raise(reader, UINT16.unpack(name_length)[0] + _LEVEL_FLAGS_KEEP_ALIVE.size)
+        return cls.from_bytes(name_length + rest)[0]
 
+    @classmethod
+    def from_bytes(cls, buffer: bytes | memoryview) -> tuple[Self, int]:
+        """Decode the variable header from an already received packet, returning the offset of the payload."""
+        if buffer[:len(_MQTT_PROTO_NAME)] == _MQTT_PROTO_NAME:
+            protocol_name, offset = "MQTT", len(_MQTT_PROTO_NAME)
+        else:
+            protocol_name, offset = decode_string_from(buffer)
+        if len(buffer) < offset + _LEVEL_FLAGS_KEEP_ALIVE.size:
+            msg = "No more data"
+            raise NoDataError(msg)
+        # protocol level, flags, keep-alive
+        protocol_level, flags, keep_alive = _LEVEL_FLAGS_KEEP_ALIVE.unpack_from(buffer, offset)
+        return cls(flags, keep_alive, protocol_name, protocol_level), offset + _LEVEL_FLAGS_KEEP_ALIVE.size
+
+    def to_bytes(self) -> bytes:
         # Protocol name
-        out.extend(encode_string(self.proto_name))
-        # Protocol level
-        out.append(self.proto_level)
-        # flags
-        out.append(self.flags)
-        # keep alive
-        out.extend(int_to_bytes(self.keep_alive, 2))
-
-        return out
+        proto_name = _MQTT_PROTO_NAME if self.proto_name == "MQTT" else encode_string(self.proto_name)
+        # Protocol level, flags, keep alive
+        return proto_name + _LEVEL_FLAGS_KEEP_ALIVE.pack(self.proto_level, self.flags, self.keep_alive)
 
     @property
     def username_flag(self) -> bool:
@@ -133,12 +145,11 @@ class ConnectVariableHeader(MQTTVariableHeader):
 
     @property
     def will_qos(self) -> int:
-        return (self.flags & 0x18) >> 3
+        return (self.flags & self.WILL_QOS_MASK) >> 3
 
     @will_qos.setter
     def will_qos(self, val: int) -> None:
-        self.flags &= 0xE7  # Reset QOS flags
-        self.flags |= val << 3
+        self.flags = (self.flags & ~self.WILL_QOS_MASK) | ((val & 0x03) << 3)
 
 
 class ConnectPayload(MQTTPayload[ConnectVariableHeader]):
@@ -178,13 +189,25 @@ class ConnectPayload(MQTTPayload[ConnectVariableHeader]):
     async def from_stream(
         cls,
         reader: StreamReader | ReaderAdapter,
-        _: MQTTFixedHeader | None,
+        fixed_header: MQTTFixedHeader | None,
         variable_header: ConnectVariableHeader | None,
     ) -> Self:
+        if fixed_header is None or variable_header is None:
+            msg = "Fixed header or variable header cannot be None"
+            raise ValueError(msg)
+
+        # read the whole payload and decode it with from_bytes, so CONNECT has a single parser
+        payload_length = fixed_header.remaining_length - variable_header.bytes_length
+        buffer = memoryview(await read_or_raise(reader, payload_length)) if payload_length > 0 else memoryview(b"")
+        return cls.from_bytes(buffer, 0, variable_header)
+
+    @classmethod
+    def from_bytes(cls, buffer: bytes | memoryview, offset: int, variable_header: ConnectVariableHeader) -> Self:
+        """Decode the payload from an already received packet, starting at `offset`."""
         payload = cls()
         #  Client identifier
         try:
-            payload.client_id = await decode_string(reader)
+            payload.client_id, offset = decode_string_from(buffer, offset)
         except NoDataError:
             payload.client_id = None
 
@@ -196,23 +219,25 @@ class ConnectPayload(MQTTPayload[ConnectVariableHeader]):
             payload.client_id_is_random = True
 
         # Read will topic, username and password
-        if variable_header is not None and variable_header.will_flag:
+        flags = variable_header.flags
+        if flags & _WILL_FLAG:
             try:
-                payload.will_topic = await decode_string(reader)
-                payload.will_message = await decode_data_with_length(reader)
+                payload.will_topic, offset = decode_string_from(buffer, offset)
+                will_message, offset = decode_data_with_length_from(buffer, offset)
+                payload.will_message = will_message.tobytes()
             except NoDataError:
                 payload.will_topic = None
                 payload.will_message = None
 
-        if variable_header is not None and variable_header.username_flag:
+        if flags & _USERNAME_FLAG:
             try:
-                payload.username = await decode_string(reader)
+                payload.username, offset = decode_string_from(buffer, offset)
             except NoDataError:
                 payload.username = None
 
-        if variable_header is not None and variable_header.password_flag:
+        if flags & _PASSWORD_FLAG:
             try:
-                payload.password = await decode_string(reader)
+                payload.password, offset = decode_string_from(buffer, offset)
             except NoDataError:
                 payload.password = None
 
@@ -223,27 +248,38 @@ class ConnectPayload(MQTTPayload[ConnectVariableHeader]):
         fixed_header: MQTTFixedHeader | None = None,
         variable_header: ConnectVariableHeader | None = None,
     ) -> bytes | bytearray:
-        out = bytearray()
+        fields: list[bytes | bytearray] = []
         # Client identifier
         if self.client_id is not None:
-            out.extend(encode_string(self.client_id))
+            fields.append(self.client_id.encode("utf-8"))
+        flags = variable_header.flags if variable_header is not None else 0
         # Will topic / message
-        if variable_header is not None and variable_header.will_flag:
+        if flags & _WILL_FLAG:
             if self.will_topic is not None:
-                out.extend(encode_string(self.will_topic))
+                fields.append(self.will_topic.encode("utf-8"))
             if self.will_message is not None:
-                out.extend(encode_data_with_length(self.will_message))
+                fields.append(self.will_message)
         # username
-        if variable_header is not None and variable_header.username_flag and self.username is not None:
-            out.extend(encode_string(self.username))
+        if flags & _USERNAME_FLAG and self.username is not None:
+            fields.append(self.username.encode("utf-8"))
         # password
-        if variable_header is not None and variable_header.password_flag and self.password is not None:
-            out.extend(encode_string(self.password))
-
+        if flags & _PASSWORD_FLAG and self.password is not None:
+            fields.append(self.password.encode("utf-8"))
+
+        # every field is prefixed by its length, so the payload size is known before writing it
+        out = bytearray(sum(len(field) for field in fields) + UINT16.size * len(fields))
+        offset = 0
+        for field in fields:
+            UINT16.pack_into(out, offset, len(field))
+            offset += UINT16.size
+            out[offset:offset + len(field)] = field
+            offset += len(field)
         return out
 
 
 class ConnectPacket(MQTTPacket[ConnectVariableHeader, ConnectPayload, MQTTFixedHeader]):
+    __slots__ = ()
+
     VARIABLE_HEADER = ConnectVariableHeader
     PAYLOAD = ConnectPayload
 
@@ -260,9 +296,30 @@ class ConnectPacket(MQTTPacket[ConnectVariableHeader, ConnectPayload, MQTTFixedH
                 msg = f"Invalid fixed packet type {fixed.packet_type} for ConnectPacket init"
                 raise AMQTTError(msg)
             header = fixed
-        super().__init__(header)
-        self.variable_header = variable_header
-        self.payload = payload
+        super().__init__(header, variable_header, payload)
+
+    @classmethod
+    async def from_stream(
+        cls,
+        reader: ReaderAdapter,
+        fixed_header: MQTTFixedHeader | None = None,
+        variable_header: ConnectVariableHeader | None = None,
+    ) -> Self:
+        """Decode a CONNECT packet, reading its variable header and payload from the stream at once."""
+        if variable_header is not None:
+            return await super().from_stream(reader, fixed_header, variable_header)
+        if fixed_header is None:
+            fixed_header = await cls.FIXED_HEADER.from_stream(reader)
+            if fixed_header is None:
+                msg = "No data to decode MQTT packet fixed header"
+                raise NoDataError(msg)
+
+        buffer = memoryview(await read_or_raise(reader, fixed_header.remaining_length))
+        variable_header, offset = ConnectVariableHeader.from_bytes(buffer)
+        payload = ConnectPayload.from_bytes(buffer, offset, variable_header)
+        instance = cls(fixed_header, variable_header, payload)
+        instance.protocol_ts = datetime.now(UTC)
+        return instance
 
     @property
     def proto_name(self) -> str:
@@ -297,56 +354,56 @@ class ConnectPacket(MQTTPacket[ConnectVariableHeader, ConnectPayload, MQTTFixedH
         if self.variable_header is None:
             msg = "Variable header is not set"
             raise ValueError(msg)
-        return self.variable_header.username_flag
+        return self.variable_header.flags & _USERNAME_FLAG != 0
 
     @username_flag.setter
     def username_flag(self, flag: bool) -> None:
         if self.variable_header is None:
             msg = "Variable header is not set"
             raise ValueError(msg)
-        self.variable_header.username_flag = flag
+        self.variable_header.flags = (self.variable_header.flags & ~_USERNAME_FLAG) | (bool(flag) * _USERNAME_FLAG)
 
     @property
     def password_flag(self) -> bool:
         if self.variable_header is None:
             msg = "Variable header is not set"
             raise ValueError(msg)
-        return self.variable_header.password_flag
+        return self.variable_header.flags & _PASSWORD_FLAG != 0
 
     @password_flag.setter
     def password_flag(self, flag: bool) -> None:
         if self.variable_header is None:
             msg = "Variable header is not set"
             raise ValueError(msg)
-        self.variable_header.password_flag = flag
+        self.variable_header.flags = (self.variable_header.flags & ~_PASSWORD_FLAG) | (bool(flag) * _PASSWORD_FLAG)
 
     @property
     def clean_session_flag(self) -> bool:
         if self.variable_header is None:
             msg = "Variable header is not set"
             raise ValueError(msg)
-        return self.variable_header.clean_session_flag
+        return self.variable_header.flags & _CLEAN_SESSION_FLAG != 0
 
     @clean_session_flag.setter
     def clean_session_flag(self, flag: bool) -> None:
         if self.variable_header is None:
             msg = "Variable header is not set"
             raise ValueError(msg)
-        self.variable_header.clean_session_flag = flag
+        self.variable_header.flags = (self.variable_header.flags & ~_CLEAN_SESSION_FLAG) | (bool(flag) * _CLEAN_SESSION_FLAG)
 
     @property
     def will_retain_flag(self) -> bool:
         if self.variable_header is None:
             msg = "Variable header is not set"
             raise ValueError(msg)
-        return self.variable_header.will_retain_flag
+        return self.variable_header.flags & _WILL_RETAIN_FLAG != 0
 
     @will_retain_flag.setter
     def will_retain_flag(self, flag: bool) -> None:
         if self.variable_header is None:
             msg = "Variable header is not set"
             raise ValueError(msg)
-        self.variable_header.will_retain_flag = flag
+        self.variable_header.flags = (self.variable_header.flags & ~_WILL_RETAIN_FLAG) | (bool(flag) * _WILL_RETAIN_FLAG)
 
     @property
     def will_qos(self) -> int:
@@ -367,28 +424,28 @@ class ConnectPacket(MQTTPacket[ConnectVariableHeader, ConnectPayload, MQTTFixedH
         if self.variable_header is None:
             msg = "Variable header is not set"
             raise ValueError(msg)
-        return self.variable_header.will_flag
+        return self.variable_header.flags & _WILL_FLAG != 0
 
     @will_flag.setter
     def will_flag(self, flag: bool) -> None:
         if self.variable_header is None:
             msg = "Variable header is not set"
             raise ValueError(msg)
-        self.variable_header.will_flag = flag
+        self.variable_header.flags = (self.variable_header.flags & ~_WILL_FLAG) | (bool(flag) * _WILL_FLAG)
 
     @property
     def reserved_flag(self) -> bool:
         if self.variable_header is None:
             msg = "Variable header is not set"
             raise ValueError(msg)
-        return self.variable_header.reserved_flag
+        return self.variable_header.flags & _RESERVED_FLAG != 0
 
     @reserved_flag.setter
     def reserved_flag(self, flag: bool) -> None:
         if self.variable_header is None:
             msg = "Variable header is not set"
             raise ValueError(msg)
-        self.variable_header.reserved_flag = flag
+        self.variable_header.flags = (self.variable_header.flags & ~_RESERVED_FLAG) | (bool(flag) * _RESERVED_FLAG)
 
     @property
     def client_id(self) -> str | None:
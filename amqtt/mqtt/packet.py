@@ -8,12 +8,11 @@ except ImportError:
 
     UTC = timezone.utc
 
-from struct import unpack
 from typing import Any, Generic, cast
 from typing_extensions import Self, TypeVar
 
 from amqtt.adapters import ReaderAdapter, WriterAdapter
-from amqtt.codecs_amqtt import bytes_to_hex_str, decode_packet_id, int_to_bytes, read_or_raise
+from amqtt.codecs_amqtt import UINT16, bytes_to_hex_str, decode_packet_id, read_or_raise
 from amqtt.errors import CodecError, MQTTError, NoDataError
 
 RESERVED_0 = 0x00
@@ -33,6 +32,22 @@ PINGRESP = 0x0D
 DISCONNECT = 0x0E
 RESERVED_15 = 0x0F
 
+# bit offsets of the (at most four) 7-bit groups of the remaining length
+_REMAINING_LENGTH_SHIFTS = (0, 7, 14, 21)
+
+
+def _encode_remaining_length(encoded: bytearray, length: int) -> bytes:
+    """Encode the remaining length as per MQTT protocol, appending it after the type/flags byte."""
+    while True:
+        length_byte = length % 0x80
+        length //= 0x80
+        if length > 0:
+            length_byte |= 0x80
+        encoded.append(length_byte)
+        if length <= 0:
+            break
+    return bytes(encoded)
+
 
 class MQTTFixedHeader:
     """Represents the fixed header of an MQTT packet."""
@@ -46,24 +61,12 @@ class MQTTFixedHeader:
 
     def to_bytes(self) -> bytes:
         """Encode the fixed header to bytes."""
-
-        def encode_remaining_length(length: int) -> bytes:
-            """Encode the remaining length as per MQTT protocol."""
-            encoded = bytearray()
-            while True:
-                length_byte = length % 0x80
-                length //= 0x80
-                if length > 0:
-                    length_byte |= 0x80
-                encoded.append(length_byte)
-                if length <= 0:
-                    break
-            return bytes(encoded)
-
         try:
             packet_type_flags = (self.packet_type << 4) | self.flags
-            encoded_length = encode_remaining_length(self.remaining_length)
-            return bytes([packet_type_flags]) + encoded_length
+            if 0 <= self.remaining_length < 0x80:
+                # acks, pings, CONNACK and most small packets fit the remaining length in a single byte
+                return bytes((packet_type_flags, self.remaining_length))
+            return _encode_remaining_length(bytearray((packet_type_flags,)), self.remaining_length)
         except OverflowError as exc:
             msg = f"Fixed header encoding failed: {exc}"
             raise CodecError(msg) from exc
@@ -74,7 +77,15 @@ class MQTTFixedHeader:
 
     @property
     def bytes_length(self) -> int:
-        return len(self.to_bytes())
+        # type/flags byte plus one byte per 7-bit group of the remaining length
+        length = self.remaining_length
+        if length < 0x80:
+            return 2
+        if length < 0x4000:
+            return 3
+        if length < 0x200000:
+            return 4
+        return 5
 
     @classmethod
     async def from_stream(cls: type[Self], reader: ReaderAdapter) -> "Self | None":
@@ -82,26 +93,20 @@ class MQTTFixedHeader:
 
         async def decode_remaining_length() -> int:
             """Decode the remaining length from the stream."""
-            multiplier: int
-            value: int
-            multiplier, value = 1, 0
-            buffer = bytearray()
-            while True:
-                encoded_byte = await read_or_raise(reader, 1)
-                byte_value = unpack("!B", encoded_byte)[0]
-                buffer.append(byte_value)
-                value += (byte_value & 0x7F) * multiplier
-                if (byte_value & 0x80) == 0:
-                    break
-                multiplier *= 128
-                if multiplier > 128**3:
-                    msg = f"Invalid remaining length bytes:{bytes_to_hex_str(buffer)}, packet_type={packet_type}"
-                    raise MQTTError(msg)
-            return value
+            value = 0
+            for shift in _REMAINING_LENGTH_SHIFTS:
+                byte_value = (await read_or_raise(reader, 1))[0]
+                value |= (byte_value & 0x7F) << shift
+                if not byte_value & 0x80:
+                    return value
+            # all four bytes had the continuation bit set, so they can be rebuilt from the value for the error
+            encoded = bytes(((value >> shift) & 0x7F) | 0x80 for shift in _REMAINING_LENGTH_SHIFTS)
+            msg = f"Invalid remaining length bytes:{bytes_to_hex_str(encoded)}, packet_type={packet_type}"
+            raise MQTTError(msg)
 
         try:
             byte1 = await read_or_raise(reader, 1)
-            int1 = unpack("!B", byte1)[0]
+            int1 = byte1[0]
             packet_type = (int1 & 0xF0) >> 4
             flags = int1 & 0x0F
             remaining_length = await decode_remaining_length()
@@ -120,6 +125,8 @@ _FH = TypeVar("_FH", bound=MQTTFixedHeader)
 class MQTTVariableHeader(ABC):
     """Abstract base class for MQTT variable headers."""
 
+    __slots__ = ()
+
     async def to_stream(self, writer: asyncio.StreamWriter) -> None:
         writer.write(self.to_bytes())
         await writer.drain()
@@ -148,7 +155,12 @@ class PacketIdVariableHeader(MQTTVariableHeader):
         self.packet_id = packet_id
 
     def to_bytes(self) -> bytes:
-        return int_to_bytes(self.packet_id, 2)
+        return UINT16.pack(self.packet_id)
+
+    @property
+    def bytes_length(self) -> int:
+        # payload decoders subtract this from the remaining length; a packet id is always two bytes
+        return 2
 
     @classmethod
     async def from_stream(
@@ -170,6 +182,8 @@ _VH = TypeVar("_VH", bound=MQTTVariableHeader | None)
 class MQTTPayload(ABC, Generic[_VH]):
     """Abstract base class for MQTT payloads."""
 
+    __slots__ = ()
+
     async def to_stream(self, writer: asyncio.StreamWriter) -> None:
         writer.write(self.to_bytes())
         await writer.drain()
@@ -213,8 +227,8 @@ class MQTTPacket(Generic[_VH, _P, _FH]):
         await writer.drain()
         self.protocol_ts = datetime.now(UTC)
 
-    def to_bytes(self) -> bytes:
-        """Serialize the packet into bytes."""
+    def to_buffers(self) -> tuple[bytes | bytearray, bytes | bytearray, bytes | bytearray]:
+        """Serialize the packet into its fixed header, variable header and payload segments."""
         variable_header_bytes = self.variable_header.to_bytes() if self.variable_header is not None else b""
         payload_bytes = self.payload.to_bytes(self.fixed_header, self.variable_header) if self.payload is not None else b""
 
@@ -222,8 +236,12 @@ class MQTTPacket(Generic[_VH, _P, _FH]):
         if self.fixed_header:
             self.fixed_header.remaining_length = len(variable_header_bytes) + len(payload_bytes)
             fixed_header_bytes = self.fixed_header.to_bytes()
+        return fixed_header_bytes, variable_header_bytes, payload_bytes
 
-        return fixed_header_bytes + variable_header_bytes + payload_bytes
+    def to_bytes(self) -> bytes:
+        """Serialize the packet into bytes."""
+        # join copies each part once, where chained + would copy the header and variable header twice
+        return b"".join(self.to_buffers())
 
     @classmethod
     async def from_stream(
@@ -1,8 +1,13 @@
 from amqtt.errors import AMQTTError
 from amqtt.mqtt.packet import PINGREQ, MQTTFixedHeader, MQTTPacket
 
+# PINGREQ is fixed-header only, so every default packet has the same wire bytes
+_PINGREQ_BYTES = MQTTFixedHeader(PINGREQ, 0x00).to_bytes()
+
 
 class PingReqPacket(MQTTPacket[None, None, MQTTFixedHeader]):
+    __slots__ = ()
+
     VARIABLE_HEADER = None
     PAYLOAD = None
 
@@ -17,3 +22,8 @@ class PingReqPacket(MQTTPacket[None, None, MQTTFixedHeader]):
         super().__init__(header)
         self.variable_header = None
         self.payload = None
+
+    def to_bytes(self) -> bytes:
+        if self.fixed_header.flags == 0x00:
+            return _PINGREQ_BYTES
+        return super().to_bytes()
@@ -3,8 +3,13 @@ from typing_extensions import Self
 from amqtt.errors import AMQTTError
 from amqtt.mqtt.packet import PINGRESP, MQTTFixedHeader, MQTTPacket
 
+# PINGRESP is fixed-header only, so every default packet has the same wire bytes
+_PINGRESP_BYTES = MQTTFixedHeader(PINGRESP, 0x00).to_bytes()
+
 
 class PingRespPacket(MQTTPacket[None, None, MQTTFixedHeader]):
+    __slots__ = ()
+
     VARIABLE_HEADER = None
     PAYLOAD = None
 
@@ -20,6 +25,11 @@ class PingRespPacket(MQTTPacket[None, None, MQTTFixedHeader]):
         self.variable_header = None
         self.payload = None
 
+    def to_bytes(self) -> bytes:
+        if self.fixed_header.flags == 0x00:
+            return _PINGRESP_BYTES
+        return super().to_bytes()
+
     @classmethod
     def build(cls) -> Self:
         return cls()
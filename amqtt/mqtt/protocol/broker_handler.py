@@ -1,6 +1,8 @@
 import asyncio
-from asyncio import AbstractEventLoop, Queue
-from typing import TYPE_CHECKING
+from asyncio import AbstractEventLoop
+from collections import deque
+from sys import intern
+from typing import TYPE_CHECKING, TypeVar
 
 from amqtt.adapters import ReaderAdapter, WriterAdapter
 from amqtt.errors import MQTTError
@@ -28,17 +30,23 @@ from amqtt.utils import format_client_message
 
 _MQTT_PROTOCOL_LEVEL_SUPPORTED = 4
 
+_T = TypeVar("_T")
+
 if TYPE_CHECKING:
     from amqtt.broker import BrokerContext
 
 
 class Subscription:
+    __slots__ = ("packet_id", "topics")
+
     def __init__(self, packet_id: int, topics: list[tuple[str, int]]) -> None:
         self.packet_id = packet_id
         self.topics = topics
 
 
 class UnSubscription:
+    __slots__ = ("packet_id", "topics")
+
     def __init__(self, packet_id: int, topics: list[str]) -> None:
         self.packet_id = packet_id
         self.topics = topics
@@ -53,8 +61,12 @@ class BrokerProtocolHandler(ProtocolHandler["BrokerContext"]):
     ) -> None:
         super().__init__(plugins_manager, session, loop)
         self._disconnect_waiter: asyncio.Future[DisconnectPacket | None] | None = None
-        self._pending_subscriptions: Queue[Subscription] = Queue()
-        self._pending_unsubscriptions: Queue[UnSubscription] = Queue()
+        # the reader task appends and the broker's client loop is the only consumer, so a deque
+        # with a wake-up event replaces asyncio.Queue and its per-put waiter bookkeeping
+        self._pending_subscriptions: deque[Subscription] = deque()
+        self._pending_subscriptions_added = asyncio.Event()
+        self._pending_unsubscriptions: deque[UnSubscription] = deque()
+        self._pending_unsubscriptions_added = asyncio.Event()
 
     async def start(self) -> None:
         await super().start()
@@ -69,10 +81,8 @@ class BrokerProtocolHandler(ProtocolHandler["BrokerContext"]):
             self._disconnect_waiter.set_result(None)
         self._disconnect_waiter = None  # Reset the disconnect waiter
         # Clear pending subscriptions and unsubscriptions
-        while not self._pending_subscriptions.empty():
-            self._pending_subscriptions.get_nowait()
-        while not self._pending_unsubscriptions.empty():
-            self._pending_unsubscriptions.get_nowait()
+        self._pending_subscriptions.clear()
+        self._pending_unsubscriptions.clear()
 
     async def wait_disconnect(self) -> DisconnectPacket | None:
         """Wait for a disconnect packet or connection closure."""
@@ -109,6 +119,7 @@ class BrokerProtocolHandler(ProtocolHandler["BrokerContext"]):
             self._disconnect_waiter.set_result(None)
 
     async def handle_pingreq(self, pingreq: PingReqPacket) -> None:
+        # a fresh packet per send keeps protocol_ts per connection; the wire bytes are cached by the class
         await self._send_packet(PingRespPacket.build())
 
     async def handle_subscribe(self, subscribe: SubscribePacket) -> None:
@@ -119,8 +130,11 @@ class BrokerProtocolHandler(ProtocolHandler["BrokerContext"]):
             msg = "SUBSCRIBE packet: payload not initialized."
             raise MQTTError(msg)
 
-        subscription: Subscription = Subscription(subscribe.variable_header.packet_id, subscribe.payload.topics)
-        await self._pending_subscriptions.put(subscription)
+        # filters become keys of the broker's subscription table; interning lets repeated filters share one string
+        topics = [(intern(topic), qos) for topic, qos in subscribe.payload.topics]
+        subscription: Subscription = Subscription(subscribe.variable_header.packet_id, topics)
+        self._pending_subscriptions.append(subscription)
+        self._pending_subscriptions_added.set()
 
     async def handle_unsubscribe(self, unsubscribe: UnsubscribePacket) -> None:
         if unsubscribe.variable_header is None:
@@ -130,13 +144,21 @@ class BrokerProtocolHandler(ProtocolHandler["BrokerContext"]):
             msg = "UNSUBSCRIBE packet: payload not initialized."
             raise MQTTError(msg)
         unsubscription: UnSubscription = UnSubscription(unsubscribe.variable_header.packet_id, unsubscribe.payload.topics)
-        await self._pending_unsubscriptions.put(unsubscription)
+        self._pending_unsubscriptions.append(unsubscription)
+        self._pending_unsubscriptions_added.set()
+
+    @staticmethod
+    async def _next_pending(pending: deque[_T], added: asyncio.Event) -> _T:
+        while not pending:
+            added.clear()
+            await added.wait()
+        return pending.popleft()
 
     async def get_next_pending_subscription(self) -> Subscription:
-        return await self._pending_subscriptions.get()
+        return await self._next_pending(self._pending_subscriptions, self._pending_subscriptions_added)
 
     async def get_next_pending_unsubscription(self) -> UnSubscription:
-        return await self._pending_unsubscriptions.get()
+        return await self._next_pending(self._pending_unsubscriptions, self._pending_unsubscriptions_added)
 
     async def mqtt_acknowledge_subscription(self, packet_id: int, return_codes: list[int]) -> None:
         suback = SubackPacket.build(packet_id, return_codes)
@@ -219,8 +241,10 @@ class BrokerProtocolHandler(ProtocolHandler["BrokerContext"]):
                 connack = ConnackPacket.build(0, IDENTIFIER_REJECTED)
 
             if connack is not None:
+                connack_bytes = connack.to_bytes()
                 await plugins_manager.fire_event(MQTTEvents.PACKET_SENT, packet=connack)
-                await connack.to_stream(writer)
+                # closing the writer flushes it, so the rejection is written without a separate drain
+                writer.write(connack_bytes)
                 await writer.close()
                 raise MQTTError(error_msg) from None
 
@@ -240,10 +264,5 @@ class BrokerProtocolHandler(ProtocolHandler["BrokerContext"]):
 
         incoming_session.keep_alive = max(connect.keep_alive, 0)
 
-        if connect.keep_alive > 0:
-            incoming_session.keep_alive = connect.keep_alive
-        else:
-            incoming_session.keep_alive = 0
-
         handler = cls(plugins_manager, loop=loop)
         return handler, incoming_session
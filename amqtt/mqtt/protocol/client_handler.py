@@ -1,5 +1,5 @@
 import asyncio
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from amqtt.errors import AMQTTError, NoDataError
 from amqtt.events import MQTTEvents
@@ -29,7 +29,9 @@ class ClientProtocolHandler(ProtocolHandler["ClientContext"]):
     ) -> None:
         super().__init__(plugins_manager, session, loop=loop)
         self._ping_task: asyncio.Task[Any] | None = None
-        self._pingresp_queue: asyncio.Queue[PingRespPacket] = asyncio.Queue()
+        # a PINGRESP only answers the pings in flight, so an event wakes every waiting ping at once
+        self._pingresp_event = asyncio.Event()
+        self._last_pingresp: PingRespPacket | None = None
         self._subscriptions_waiter: dict[int, asyncio.Future[list[int]]] = {}
         self._unsubscriptions_waiter: dict[int, asyncio.Future[Any]] = {}
         self._disconnect_waiter: asyncio.Future[Any] | None = asyncio.Future()
@@ -41,7 +43,7 @@ class ClientProtocolHandler(ProtocolHandler["ClientContext"]):
 
     async def stop(self) -> None:
         await super().stop()
-        if self._ping_task and not self._ping_task.cancelled():
+        if self._ping_task and not self._ping_task.done():
             self.logger.debug("Cancel ping task")
             self._ping_task.cancel()
 
@@ -49,39 +51,33 @@ class ClientProtocolHandler(ProtocolHandler["ClientContext"]):
             self._disconnect_waiter.cancel()
 
     def _build_connect_packet(self) -> ConnectPacket:
-        vh = ConnectVariableHeader()
-        payload = ConnectPayload()
-
         if self.session is None:
             msg = "Session is not initialized."
             raise AMQTTError(msg)
 
-        vh.keep_alive = self.session.keep_alive
-        vh.clean_session_flag = self.session.clean_session if self.session.clean_session is not None else False
-        vh.will_retain_flag = self.session.will_retain if self.session.will_retain is not None else False
-        payload.client_id = self.session.client_id
-
+        # assemble the connect flags up front instead of setting them one property at a time
+        flags = 0x00
+        if self.session.clean_session:
+            flags |= ConnectVariableHeader.CLEAN_SESSION_FLAG
+        if self.session.will_retain:
+            flags |= ConnectVariableHeader.WILL_RETAIN_FLAG
         if self.session.username:
-            vh.username_flag = True
-            payload.username = self.session.username
-        else:
-            vh.username_flag = False
-
+            flags |= ConnectVariableHeader.USERNAME_FLAG
         if self.session.password:
-            vh.password_flag = True
-            payload.password = self.session.password
-        else:
-            vh.password_flag = False
-
+            flags |= ConnectVariableHeader.PASSWORD_FLAG
         if self.session.will_flag:
-            vh.will_flag = True
+            flags |= ConnectVariableHeader.WILL_FLAG
             if self.session.will_qos is not None:
-                vh.will_qos = self.session.will_qos
-            payload.will_message = self.session.will_message
-            payload.will_topic = self.session.will_topic
-        else:
-            vh.will_flag = False
-
+                flags |= (self.session.will_qos << 3) & ConnectVariableHeader.WILL_QOS_MASK
+
+        vh = ConnectVariableHeader(flags, self.session.keep_alive)
+        payload = ConnectPayload(
+            client_id=self.session.client_id,
+            will_topic=self.session.will_topic if self.session.will_flag else None,
+            will_message=self.session.will_message if self.session.will_flag else None,
+            username=self.session.username if self.session.username else None,
+            password=self.session.password if self.session.password else None,
+        )
         return ConnectPacket(variable_header=vh, payload=payload)
 
     async def mqtt_connect(self) -> int | None:
@@ -99,14 +95,10 @@ class ClientProtocolHandler(ProtocolHandler["ClientContext"]):
         return connack.return_code
 
     def handle_write_timeout(self) -> None:
-        try:
-            if not self._ping_task:
-                self.logger.debug("Scheduling Ping")
-                self._ping_task = asyncio.create_task(self.mqtt_ping())
-        except asyncio.InvalidStateError as e:
-            self.logger.warning(f"Invalid state while scheduling ping task: {e!r}")
-        except asyncio.CancelledError as e:
-            self.logger.info(f"Ping task was cancelled: {e!r}")
+        # the task itself tells whether a keepalive ping is still in flight, so at most one is scheduled
+        if self._ping_task is None or self._ping_task.done():
+            self.logger.debug("Scheduling Ping")
+            self._ping_task = asyncio.create_task(self.mqtt_ping())
 
     def handle_read_timeout(self) -> None:
         pass
@@ -124,13 +116,7 @@ class ClientProtocolHandler(ProtocolHandler["ClientContext"]):
             msg = f"Invalid variable header in SUBSCRIBE packet: {subscribe.variable_header}"
             raise AMQTTError(msg)
 
-        waiter: asyncio.Future[list[int]] = asyncio.Future()
-        self._subscriptions_waiter[subscribe.variable_header.packet_id] = waiter
-        try:
-            return_codes = await waiter
-        finally:
-            del self._subscriptions_waiter[subscribe.variable_header.packet_id]
-        return return_codes
+        return await self._add_waiter(self._subscriptions_waiter, subscribe.variable_header.packet_id)
 
     async def handle_suback(self, suback: SubackPacket) -> None:
         if suback.variable_header is None:
@@ -144,7 +130,7 @@ class ClientProtocolHandler(ProtocolHandler["ClientContext"]):
 
         waiter = self._subscriptions_waiter.get(packet_id)
         if waiter is not None:
-            waiter.set_result(suback.payload.return_codes)
+            waiter.set_result(list(suback.payload.return_codes))
         else:
             self.logger.warning(f"Received SUBACK for unknown pending subscription with Id: {packet_id}")
 
@@ -160,12 +146,7 @@ class ClientProtocolHandler(ProtocolHandler["ClientContext"]):
             raise AMQTTError(msg)
 
         await self._send_packet(unsubscribe)
-        waiter: asyncio.Future[Any] = asyncio.Future()
-        self._unsubscriptions_waiter[unsubscribe.variable_header.packet_id] = waiter
-        try:
-            await waiter
-        finally:
-            del self._unsubscriptions_waiter[unsubscribe.variable_header.packet_id]
+        await self._add_waiter(self._unsubscriptions_waiter, unsubscribe.variable_header.packet_id)
 
     async def handle_unsuback(self, unsuback: UnsubackPacket) -> None:
         if unsuback.variable_header is None:
@@ -180,20 +161,19 @@ class ClientProtocolHandler(ProtocolHandler["ClientContext"]):
             self.logger.warning(f"Received UNSUBACK for unknown pending unsubscription with Id: {packet_id}")
 
     async def mqtt_disconnect(self) -> None:
-        disconnect_packet = DisconnectPacket()
-        await self._send_packet(disconnect_packet)
+        # a fresh packet per send keeps protocol_ts per connection; the wire bytes are cached by the class
+        await self._send_packet(DisconnectPacket())
 
     async def mqtt_ping(self) -> PingRespPacket:
-        ping_packet = PingReqPacket()
-        try:
-            await self._send_packet(ping_packet)
-            resp = await self._pingresp_queue.get()
-        finally:
-            self._ping_task = None  # Ensure the task is cleaned up
-        return resp
+        # drop a response left over from an earlier ping before asking for a new one
+        self._pingresp_event.clear()
+        await self._send_packet(PingReqPacket())
+        await self._pingresp_event.wait()
+        return cast("PingRespPacket", self._last_pingresp)
 
     async def handle_pingresp(self, pingresp: PingRespPacket) -> None:
-        await self._pingresp_queue.put(pingresp)
+        self._last_pingresp = pingresp
+        self._pingresp_event.set()
 
     async def handle_connection_closed(self) -> None:
         self.logger.debug("Broker closed connection")
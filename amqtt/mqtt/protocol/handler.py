@@ -62,6 +62,24 @@ from amqtt.plugins.manager import PluginManager
 from amqtt.session import INCOMING, OUTGOING, ApplicationMessage, IncomingApplicationMessage, OutgoingApplicationMessage, Session
 
 C = TypeVar("C", bound=BaseContext)
+_T = TypeVar("_T")
+
+# incoming packet type -> name of the coroutine handling it, resolved on the instance so subclass overrides apply
+_PACKET_HANDLERS: dict[int, str] = {
+    CONNACK: "handle_connack",
+    SUBSCRIBE: "handle_subscribe",
+    UNSUBSCRIBE: "handle_unsubscribe",
+    SUBACK: "handle_suback",
+    UNSUBACK: "handle_unsuback",
+    PUBACK: "handle_puback",
+    PUBREC: "handle_pubrec",
+    PUBREL: "handle_pubrel",
+    PUBCOMP: "handle_pubcomp",
+    PINGREQ: "handle_pingreq",
+    PINGRESP: "handle_pingresp",
+    PUBLISH: "handle_publish",
+    DISCONNECT: "handle_disconnect",
+}
 
 
 class ProtocolHandler(Generic[C]):
@@ -90,6 +108,8 @@ class ProtocolHandler(Generic[C]):
 
         self._reader_task: asyncio.Task[None] | None = None
         self._keepalive_task: asyncio.TimerHandle | None = None
+        self._read_timeout_task: asyncio.TimerHandle | None = None
+        self._last_read_time = 0.0
         self._reader_ready: asyncio.Event | None = None
         self._reader_stopped = asyncio.Event()
         self._puback_waiters: dict[int, asyncio.Future[PubackPacket]] = {}
@@ -144,6 +164,9 @@ class ProtocolHandler(Generic[C]):
         self._stop_waiters()
         if self._keepalive_task:
             self._keepalive_task.cancel()
+        if self._read_timeout_task is not None:
+            self._read_timeout_task.cancel()
+            self._read_timeout_task = None
         self.logger.debug("Waiting for tasks to be stopped")
         if self._reader_task and not self._reader_task.done():
             self._reader_task.cancel()
@@ -176,6 +199,22 @@ class ProtocolHandler(Generic[C]):
                 raise AMQTTError(msg)
             waiter.cancel()
 
+    def _add_waiter(self, waiters: dict[int, asyncio.Future[_T]], packet_id: int) -> asyncio.Future[_T]:
+        """Register a future for the response to `packet_id`, removed from `waiters` once it is done.
+
+        The removal runs as a done callback, so it also happens when the awaiting task is cancelled; it checks
+        identity since a cancelled waiter may already have been replaced under the same packet id.
+        """
+        waiter: asyncio.Future[_T] = self._loop.create_future()
+        waiters[packet_id] = waiter
+
+        def _remove(done: asyncio.Future[_T]) -> None:
+            if waiters.get(packet_id) is done:
+                del waiters[packet_id]
+
+        waiter.add_done_callback(_remove)
+        return waiter
+
     async def _retry_deliveries(self) -> None:
         """Handle [MQTT-4.4.0-1] by resending PUBLISH and PUBREL messages for pending out messages."""
         self.logger.debug("Begin messages delivery retries")
@@ -280,7 +319,8 @@ class ProtocolHandler(Generic[C]):
             else:
                 try:
                     self.session.delivered_message_queue.put_nowait(app_message)
-                    self.logger.debug(f"Message added to delivery queue: {app_message}")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(f"Message added to delivery queue: {app_message}")
                 except QueueShutDown as e:
                     self.logger.warning(f"Delivered messages queue is shut down. QOS_0 message discarded: {e}")
                 except QueueFull as e:
@@ -414,17 +454,14 @@ class ProtocolHandler(Generic[C]):
             await self._send_packet(pubrec_packet)
             app_message.pubrec_packet = pubrec_packet
             # Wait PUBREL
-            if app_message.packet_id in self._pubrel_waiters and not self._pubrel_waiters[app_message.packet_id].done():
+            existing_waiter = self._pubrel_waiters.get(app_message.packet_id)
+            if existing_waiter is not None and not existing_waiter.done():
                 # PUBREL waiter already exists for this packet ID
                 message = f"A waiter already exists for message Id '{app_message.packet_id}', canceling it"
                 self.logger.warning(message)
-                self._pubrel_waiters[app_message.packet_id].cancel()
+                existing_waiter.cancel()
             try:
-                waiter_pub_rel: asyncio.Future[PubrelPacket] = asyncio.Future()
-                self._pubrel_waiters[app_message.packet_id] = waiter_pub_rel
-                await waiter_pub_rel
-                del self._pubrel_waiters[app_message.packet_id]
-                app_message.pubrel_packet = waiter_pub_rel.result()
+                app_message.pubrel_packet = await self._add_waiter(self._pubrel_waiters, app_message.packet_id)
                 # Initiate delivery and discard message
                 await self.session.delivered_message_queue.put(app_message)
                 del self.session.inflight_in[app_message.packet_id]
@@ -450,6 +487,9 @@ class ProtocolHandler(Generic[C]):
         keepalive_timeout: int | None = self.session.keep_alive
         if keepalive_timeout is not None and keepalive_timeout <= 0:
             keepalive_timeout = None
+        if keepalive_timeout is not None:
+            self._last_read_time = self._loop.time()
+            self._read_timeout_task = self._loop.call_later(keepalive_timeout, self._check_read_timeout, keepalive_timeout)
         while True:
             try:
                 self._reader_ready.set()
@@ -460,10 +500,11 @@ class ProtocolHandler(Generic[C]):
                 if self.reader is None:
                     self.logger.warning("Reader is not initialized!")
                     break
-                fixed_header = await asyncio.wait_for(MQTTFixedHeader.from_stream(self.reader), timeout=keepalive_timeout)
+                fixed_header = await MQTTFixedHeader.from_stream(self.reader)
                 if not fixed_header:
                     self.logger.debug(f"{self.session.client_id} No more data (EOF received), stopping reader coro")
                     break
+                self._last_read_time = self._loop.time()
                 if fixed_header.packet_type in (RESERVED_0, RESERVED_15):
                     self.logger.warning(
                         f"{self.session.client_id} Received reserved packet, which is forbidden: closing connection",
@@ -474,71 +515,33 @@ class ProtocolHandler(Generic[C]):
                 cls = packet_class(fixed_header)
                 packet = await cls.from_stream(self.reader, fixed_header=fixed_header)
                 await self.plugins_manager.fire_event(MQTTEvents.PACKET_RECEIVED, packet=packet, session=self.session)
-                if packet.fixed_header is None or packet.fixed_header.packet_type not in (
-                    CONNACK,
-                    SUBSCRIBE,
-                    UNSUBSCRIBE,
-                    SUBACK,
-                    UNSUBACK,
-                    PUBACK,
-                    PUBREC,
-                    PUBREL,
-                    PUBCOMP,
-                    PINGREQ,
-                    PINGRESP,
-                    PUBLISH,
-                    DISCONNECT,
-                    CONNECT,
-                ):
-                    self.logger.warning(f"{self.session.client_id} Unhandled packet type: {packet.fixed_header.packet_type}")
+                if packet.fixed_header is None:
                     continue
-
-                task: asyncio.Task[None] | None = None
-                if packet.fixed_header.packet_type == CONNACK and isinstance(packet, ConnackPacket):
-                    task = asyncio.create_task(self.handle_connack(packet))
-                elif packet.fixed_header.packet_type == SUBSCRIBE and isinstance(packet, SubscribePacket):
-                    task = asyncio.create_task(self.handle_subscribe(packet))
-                elif packet.fixed_header.packet_type == UNSUBSCRIBE and isinstance(packet, UnsubscribePacket):
-                    task = asyncio.create_task(self.handle_unsubscribe(packet))
-                elif packet.fixed_header.packet_type == SUBACK and isinstance(packet, SubackPacket):
-                    task = asyncio.create_task(self.handle_suback(packet))
-                elif packet.fixed_header.packet_type == UNSUBACK and isinstance(packet, UnsubackPacket):
-                    task = asyncio.create_task(self.handle_unsuback(packet))
-                elif packet.fixed_header.packet_type == PUBACK and isinstance(packet, PubackPacket):
-                    task = asyncio.create_task(self.handle_puback(packet))
-                elif packet.fixed_header.packet_type == PUBREC and isinstance(packet, PubrecPacket):
-                    task = asyncio.create_task(self.handle_pubrec(packet))
-                elif packet.fixed_header.packet_type == PUBREL and isinstance(packet, PubrelPacket):
-                    task = asyncio.create_task(self.handle_pubrel(packet))
-                elif packet.fixed_header.packet_type == PUBCOMP and isinstance(packet, PubcompPacket):
-                    task = asyncio.create_task(self.handle_pubcomp(packet))
-                elif packet.fixed_header.packet_type == PINGREQ and isinstance(packet, PingReqPacket):
-                    task = asyncio.create_task(self.handle_pingreq(packet))
-                elif packet.fixed_header.packet_type == PINGRESP and isinstance(packet, PingRespPacket):
-                    task = asyncio.create_task(self.handle_pingresp(packet))
-                elif packet.fixed_header.packet_type == PUBLISH and isinstance(packet, PublishPacket):
-                    task = asyncio.create_task(self.handle_publish(packet))
-                elif packet.fixed_header.packet_type == DISCONNECT and isinstance(packet, DisconnectPacket):
-                    task = asyncio.create_task(self.handle_disconnect(packet))
-                elif packet.fixed_header.packet_type == CONNECT and isinstance(packet, ConnectPacket):
+                packet_type = packet.fixed_header.packet_type
+                if packet_type == CONNECT:
                     # q: why is this not like all other inside a create_task?
                     # a: the connection needs to be established before any other packet tasks for this new session are scheduled
-                    await self.handle_connect(packet)
-                if task:
-                    running_tasks.append(task)
+                    await self.handle_connect(cast("ConnectPacket", packet))
+                    continue
+                handler_name = _PACKET_HANDLERS.get(packet_type)
+                if handler_name is None:
+                    self.logger.warning(f"{self.session.client_id} Unhandled packet type: {packet_type}")
+                    continue
+                task = asyncio.create_task(getattr(self, handler_name)(packet))
+                running_tasks.append(task)
             except MQTTError:
                 self.logger.debug("Message discarded")
             except asyncio.CancelledError:
                 self.logger.debug("Task cancelled, reader loop ending")
                 break
-            except asyncio.TimeoutError:
-                self.logger.debug(f"{self.session.client_id} Input stream read timeout")
-                self.handle_read_timeout()
             except NoDataError:
                 self.logger.debug(f"{self.session.client_id} No data available")
             except Exception as e:  # ruff: ignore[blind-except], pylint: disable=W0718
                 self.logger.warning(f"{type(self).__name__} Unhandled exception in reader coro: {e!r}")
                 break
+        if self._read_timeout_task is not None:
+            self._read_timeout_task.cancel()
+            self._read_timeout_task = None
         while running_tasks:
             running_tasks.popleft().cancel()
         await self.handle_connection_closed()
@@ -546,6 +549,28 @@ class ProtocolHandler(Generic[C]):
         self.logger.debug("Reader coro stopped")
         await self.stop()
 
+    def _check_read_timeout(self, keepalive_timeout: int) -> None:
+        """Call handle_read_timeout when nothing was read for `keepalive_timeout` seconds.
+
+        A single timer per connection re-arms itself against the time of the last packet, instead of wrapping
+        every read in a wait_for (and the task and timer it creates).
+        """
+        idle = self._loop.time() - self._last_read_time
+        try:
+            if idle >= keepalive_timeout:
+                idle = 0.0
+                if self.session is not None:
+                    self.logger.debug(f"{self.session.client_id} Input stream read timeout")
+                self.handle_read_timeout()
+        finally:
+            # re-arm even when handle_read_timeout raises, so the connection keeps its keepalive watchdog
+            if self._reader_task is not None and not self._reader_task.done():
+                self._read_timeout_task = self._loop.call_later(
+                    keepalive_timeout - idle, self._check_read_timeout, keepalive_timeout,
+                )
+            else:
+                self._read_timeout_task = None
+
     async def _send_packet(
         self,
         packet: PublishPacket
@@ -5,6 +5,8 @@ from amqtt.mqtt.packet import PUBACK, MQTTFixedHeader, MQTTPacket, PacketIdVaria
 
 
 class PubackPacket(MQTTPacket[PacketIdVariableHeader, None, MQTTFixedHeader]):
+    __slots__ = ()
+
     VARIABLE_HEADER = PacketIdVariableHeader
     PAYLOAD = None
 
@@ -1,10 +1,26 @@
+from struct import Struct
+
+try:
+    from datetime import UTC, datetime
+except ImportError:
+    from datetime import datetime, timezone
+
+    UTC = timezone.utc
+
 from typing_extensions import Self
 
-from amqtt.errors import AMQTTError
+from amqtt.adapters import ReaderAdapter
+from amqtt.codecs_amqtt import UINT16, read_or_raise
+from amqtt.errors import AMQTTError, MQTTError, NoDataError
 from amqtt.mqtt.packet import PUBCOMP, MQTTFixedHeader, MQTTPacket, PacketIdVariableHeader
 
+# type/flags byte, remaining length (always 2) and packet id
+_PUBCOMP_PACKET = Struct("!BBH")
+
 
 class PubcompPacket(MQTTPacket[PacketIdVariableHeader, None, MQTTFixedHeader]):
+    __slots__ = ()
+
     VARIABLE_HEADER = PacketIdVariableHeader
     PAYLOAD = None
 
@@ -26,6 +42,40 @@ class PubcompPacket(MQTTPacket[PacketIdVariableHeader, None, MQTTFixedHeader]):
         self.variable_header = variable_header
         self.payload = None
 
+    @classmethod
+    async def from_stream(
+        cls,
+        reader: ReaderAdapter,
+        fixed_header: MQTTFixedHeader | None = None,
+        variable_header: PacketIdVariableHeader | None = None,
+    ) -> Self:
+        """Decode a PUBCOMP packet, reading the packet id right after the fixed header.
+
+        An MQTT 3.1.1 PUBCOMP carries only the packet id, so any other remaining length is rejected.
+        """
+        if variable_header is not None:
+            return await super().from_stream(reader, fixed_header, variable_header)
+        if fixed_header is None:
+            fixed_header = await cls.FIXED_HEADER.from_stream(reader)
+            if fixed_header is None:
+                msg = "No data to decode MQTT packet fixed header"
+                raise NoDataError(msg)
+
+        if fixed_header.remaining_length != 2:
+            msg = f"Invalid PUBCOMP remaining length {fixed_header.remaining_length}, expected 2"
+            raise MQTTError(msg)
+        data = await read_or_raise(reader, 2)
+        instance = cls(fixed_header, PacketIdVariableHeader(UINT16.unpack(data)[0]))
+        instance.protocol_ts = datetime.now(UTC)
+        return instance
+
+    def to_bytes(self) -> bytes:
+        """Serialize the packet with a single struct pack instead of encoding each header separately."""
+        if self.variable_header is None:
+            return super().to_bytes()
+        self.fixed_header.remaining_length = 2
+        return _PUBCOMP_PACKET.pack((PUBCOMP << 4) | self.fixed_header.flags, 2, self.variable_header.packet_id)
+
     @classmethod
     def build(cls, packet_id: int) -> Self:
         v_header = PacketIdVariableHeader(packet_id)
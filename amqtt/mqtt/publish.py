@@ -1,14 +1,34 @@
 import asyncio
+
+try:
+    from datetime import UTC, datetime
+except ImportError:
+    from datetime import datetime, timezone
+
+    UTC = timezone.utc
+
+from functools import lru_cache
 from typing_extensions import Self
 
-from amqtt.adapters import ReaderAdapter
-from amqtt.codecs_amqtt import decode_packet_id, decode_string, encode_string, int_to_bytes, read_or_raise
+from amqtt.adapters import ReaderAdapter, WriterAdapter
+from amqtt.codecs_amqtt import UINT16, read_or_raise
 from amqtt.errors import AMQTTError, MQTTError
 from amqtt.mqtt.packet import PUBLISH, MQTTFixedHeader, MQTTPacket, MQTTPayload, MQTTVariableHeader
 
 
+@lru_cache(maxsize=1024)
+def _encode_topic_name(topic_name: str) -> bytes:
+    """Encode a topic name with its length prefix.
+
+    A broker re-encodes the same few topics for every subscriber it forwards a message to,
+    so the encoded form of recently used topics is kept.
+    """
+    topic = topic_name.encode("utf-8")
+    return UINT16.pack(len(topic)) + topic
+
+
 class PublishVariableHeader(MQTTVariableHeader):
-    __slots__ = ("packet_id", "topic_name")
+    __slots__ = ("_encoded_topic", "packet_id", "topic_name")
 
     def __init__(self, topic_name: str, packet_id: int | None = None) -> None:
         super().__init__()
@@ -17,24 +37,50 @@ class PublishVariableHeader(MQTTVariableHeader):
             raise MQTTError(msg)
         self.topic_name = topic_name
         self.packet_id = packet_id
+        # (topic name, its length-prefixed encoding); only trusted while topic_name is still that same string
+        self._encoded_topic: tuple[str, bytes] | None = None
 
     def __repr__(self) -> str:
         """Return a string representation of the PublishVariableHeader object."""
         return f"{type(self).__name__}(topic={self.topic_name}, packet_id={self.packet_id})"
 
+    def _encoded_topic_name(self) -> bytes:
+        encoded = self._encoded_topic
+        if encoded is not None and encoded[0] is self.topic_name:
+            return encoded[1]
+        topic = _encode_topic_name(self.topic_name)
+        self._encoded_topic = (self.topic_name, topic)
+        return topic
+
     def to_bytes(self) -> bytes | bytearray:
-        out = bytearray()
-        out.extend(encode_string(self.topic_name))
-        if self.packet_id is not None:
-            out.extend(int_to_bytes(self.packet_id, 2))
-        return out
+        topic = self._encoded_topic_name()
+        if self.packet_id is None:
+            return topic
+        return topic + UINT16.pack(self.packet_id)
+
+    @property
+    def bytes_length(self) -> int:
+        # the payload decoder asks for this on every inbound PUBLISH, so avoid building the header for it
+        return len(self._encoded_topic_name()) + (0 if self.packet_id is None else 2)
 
     @classmethod
     async def from_stream(cls, reader: ReaderAdapter | asyncio.StreamReader, fixed_header: MQTTFixedHeader) -> Self:
-        topic_name = await decode_string(reader)
         has_qos = (fixed_header.flags >> 1) & 0x03
-        packet_id = await decode_packet_id(reader) if has_qos else None
-        return cls(topic_name, packet_id)
+        topic_length_bytes = await read_or_raise(reader, 2)
+        topic_length: int = UINT16.unpack(topic_length_bytes)[0]
+        # the topic name and the packet id that follows it are read together
+        to_read = topic_length + 2 if has_qos else topic_length
+        data = await read_or_raise(reader, to_read) if to_read else b""
+        topic = data[:topic_length]
+        packet_id = UINT16.unpack_from(data, topic_length)[0] if has_qos else None
+        try:
+            topic_name = topic.decode("utf-8")
+        except UnicodeDecodeError:
+            return cls(str(topic), packet_id)
+        header = cls(topic_name, packet_id)
+        # valid UTF-8 re-encodes to the bytes just read, so keep them for bytes_length and forwarding
+        header._encoded_topic = (topic_name, topic_length_bytes + topic)
+        return header
 
 
 class PublishPayload(MQTTPayload[MQTTVariableHeader]):
@@ -58,25 +104,30 @@ class PublishPayload(MQTTPayload[MQTTVariableHeader]):
         fixed_header: MQTTFixedHeader | None,
         variable_header: MQTTVariableHeader | None,
     ) -> Self:
-        data = bytearray()
         if fixed_header is None or variable_header is None:
             msg = "Fixed header or variable header cannot be None"
             raise ValueError(msg)
 
         data_length = fixed_header.remaining_length - variable_header.bytes_length
-        length_read = 0
-        while length_read < data_length:
-            buffer = await read_or_raise(reader, data_length - length_read)
-            data.extend(buffer)
-            length_read = len(data)
-        return cls(bytes(data))
+        if data_length <= 0:
+            return cls(b"")
+        # read_or_raise returns exactly data_length bytes or raises, so the buffer read is kept as the payload;
+        # bytes() only copies when an adapter hands back some other buffer type
+        return cls(bytes(await read_or_raise(reader, data_length)))
 
     def __repr__(self) -> str:
         """Return a string representation of the PublishPayload object."""
         return f"{type(self).__name__}(data={repr(self.data)!r})"
 
 
+def _publish_flags(dup_flag: bool, qos: int, retain_flag: bool) -> int:
+    """Compute the PUBLISH fixed header flags (DUP, QoS, RETAIN) in one expression."""
+    return (dup_flag << 3) | (qos << 1) | retain_flag
+
+
 class PublishPacket(MQTTPacket[PublishVariableHeader, PublishPayload, MQTTFixedHeader]):
+    __slots__ = ()
+
     VARIABLE_HEADER = PublishVariableHeader
     PAYLOAD = PublishPayload
 
@@ -98,30 +149,36 @@ class PublishPacket(MQTTPacket[PublishVariableHeader, PublishPayload, MQTTFixedH
         else:
             header = fixed
 
-        super().__init__(header)
-        self.variable_header = variable_header
-        self.payload = payload
+        super().__init__(header, variable_header, payload)
+
+    def to_buffers(self) -> tuple[bytes | bytearray, bytes | bytearray, bytes | bytearray]:
+        """Serialize the packet segments in one frame; a broker runs this once per subscriber of every message."""
+        variable_header = self.variable_header
+        payload = self.payload
+        if variable_header is None or payload is None:
+            return super().to_buffers()
+        variable_header_bytes = variable_header.to_bytes()
+        payload_bytes = payload.data if payload.data is not None else b""
+        self.fixed_header.remaining_length = len(variable_header_bytes) + len(payload_bytes)
+        return self.fixed_header.to_bytes(), variable_header_bytes, payload_bytes
+
+    async def to_stream(self, writer: WriterAdapter) -> None:
+        """Write the packet to the stream without first joining the headers and the application payload."""
+        writer.writelines(self.to_buffers())
+        await writer.drain()
+        self.protocol_ts = datetime.now(UTC)
 
     @classmethod
     def build(cls, topic_name: str, message: bytes, packet_id: int | None, dup_flag: bool, qos: int | None, retain: bool) -> Self:
-        v_header = PublishVariableHeader(topic_name, packet_id)
-        payload = PublishPayload(message)
-        packet = cls(variable_header=v_header, payload=payload)
-        packet.dup_flag = dup_flag
-        packet.retain_flag = retain
-        packet.qos = qos or 0
-        return packet
+        header = MQTTFixedHeader(PUBLISH, _publish_flags(bool(dup_flag), qos or 0, bool(retain)))
+        return cls(header, PublishVariableHeader(topic_name, packet_id), PublishPayload(message))
 
     def set_flags(self, dup_flag: bool = False, qos: int = 0, retain_flag: bool = False) -> None:
-        self.dup_flag = dup_flag
-        self.retain_flag = retain_flag
-        self.qos = qos
+        # DUP, QoS and RETAIN are the only PUBLISH flags, so the whole nibble is replaced at once
+        self.fixed_header.flags = _publish_flags(bool(dup_flag), qos, bool(retain_flag))
 
     def _set_header_flag(self, val: bool, mask: int) -> None:
-        if val:
-            self.fixed_header.flags |= mask
-        else:
-            self.fixed_header.flags &= ~mask
+        self.fixed_header.flags = (self.fixed_header.flags & ~mask) | (mask if val else 0)
 
     def _get_header_flag(self, mask: int) -> bool:
         return bool(self.fixed_header.flags & mask)
@@ -5,6 +5,8 @@ from amqtt.mqtt.packet import PUBREC, MQTTFixedHeader, MQTTPacket, PacketIdVaria
 
 
 class PubrecPacket(MQTTPacket[PacketIdVariableHeader, None, MQTTFixedHeader]):
+    __slots__ = ()
+
     VARIABLE_HEADER = PacketIdVariableHeader
     PAYLOAD = None
 
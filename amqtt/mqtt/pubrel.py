@@ -5,6 +5,8 @@ from amqtt.mqtt.packet import PUBREL, MQTTFixedHeader, MQTTPacket, PacketIdVaria
 
 
 class PubrelPacket(MQTTPacket[PacketIdVariableHeader, None, MQTTFixedHeader]):
+    __slots__ = ()
+
     VARIABLE_HEADER = PacketIdVariableHeader
     PAYLOAD = None
 
@@ -2,8 +2,8 @@ import asyncio
 from typing_extensions import Self
 
 from amqtt.adapters import ReaderAdapter
-from amqtt.codecs_amqtt import bytes_to_int, int_to_bytes, read_or_raise
-from amqtt.errors import AMQTTError, NoDataError
+from amqtt.codecs_amqtt import read_or_raise
+from amqtt.errors import AMQTTError
 from amqtt.mqtt.packet import SUBACK, MQTTFixedHeader, MQTTPacket, MQTTPayload, MQTTVariableHeader, PacketIdVariableHeader
 
 
@@ -15,9 +15,10 @@ class SubackPayload(MQTTPayload[MQTTVariableHeader]):
     RETURN_CODE_02 = 0x02
     RETURN_CODE_80 = 0x80
 
-    def __init__(self, return_codes: list[int] | None = None) -> None:
+    def __init__(self, return_codes: list[int] | bytes | None = None) -> None:
         super().__init__()
-        self.return_codes = return_codes or []
+        # one byte per filter, all in 0x00-0x02 or 0x80, so the codes are kept in their wire form
+        self.return_codes: bytes = bytes(return_codes or b"")
 
     def __repr__(self) -> str:
         """Return a string representation of the SubackPayload object."""
@@ -28,10 +29,7 @@ class SubackPayload(MQTTPayload[MQTTVariableHeader]):
         fixed_header: MQTTFixedHeader | None = None,
         variable_header: MQTTVariableHeader | None = None,
     ) -> bytes:
-        out = b""
-        for return_code in self.return_codes:
-            out += int_to_bytes(return_code, 1)
-        return out
+        return self.return_codes
 
     @classmethod
     async def from_stream(
@@ -40,23 +38,18 @@ class SubackPayload(MQTTPayload[MQTTVariableHeader]):
         fixed_header: MQTTFixedHeader | None,
         variable_header: MQTTVariableHeader | None,
     ) -> Self:
-        return_codes = []
         if fixed_header is None or variable_header is None:
             msg = "Fixed header or variable header cannot be None"
             raise AMQTTError(msg)
 
         bytes_to_read = fixed_header.remaining_length - variable_header.bytes_length
-        for _ in range(bytes_to_read):
-            try:
-                return_code_byte = await read_or_raise(reader, 1)
-                return_code = bytes_to_int(return_code_byte)
-                return_codes.append(return_code)
-            except NoDataError:
-                break
-        return cls(return_codes)
+        # one byte per return code, so all of them come from a single read
+        return cls(await read_or_raise(reader, bytes_to_read) if bytes_to_read > 0 else b"")
 
 
 class SubackPacket(MQTTPacket[PacketIdVariableHeader, SubackPayload, MQTTFixedHeader]):
+    __slots__ = ()
+
     VARIABLE_HEADER = PacketIdVariableHeader
     PAYLOAD = SubackPayload
 
@@ -79,7 +72,7 @@ class SubackPacket(MQTTPacket[PacketIdVariableHeader, SubackPayload, MQTTFixedHe
         self.payload = payload
 
     @classmethod
-    def build(cls, packet_id: int, return_codes: list[int]) -> Self:
+    def build(cls, packet_id: int, return_codes: list[int] | bytes) -> Self:
         variable_header = cls.VARIABLE_HEADER(packet_id)
         payload = cls.PAYLOAD(return_codes)
         return cls(variable_header=variable_header, payload=payload)
@@ -2,7 +2,7 @@ import asyncio
 from typing_extensions import Self
 
 from amqtt.adapters import ReaderAdapter
-from amqtt.codecs_amqtt import bytes_to_int, decode_string, encode_string, int_to_bytes, read_or_raise
+from amqtt.codecs_amqtt import UINT16, decode_string_from, read_or_raise
 from amqtt.errors import AMQTTError, NoDataError
 from amqtt.mqtt.packet import SUBSCRIBE, MQTTFixedHeader, MQTTPacket, MQTTPayload, MQTTVariableHeader, PacketIdVariableHeader
 
@@ -18,11 +18,18 @@ class SubscribePayload(MQTTPayload[MQTTVariableHeader]):
         self,
         fixed_header: MQTTFixedHeader | None = None,
         variable_header: MQTTVariableHeader | None = None,
-    ) -> bytes:
-        out = b""
-        for topic in self.topics:
-            out += encode_string(topic[0])
-            out += int_to_bytes(topic[1], 1)
+    ) -> bytes | bytearray:
+        filters = [(topic.encode("utf-8"), qos) for topic, qos in self.topics]
+        # each filter is its two-byte length, the filter and its QoS byte, so the size is known once they are encoded
+        out = bytearray(sum(len(topic) for topic, _ in filters) + (UINT16.size + 1) * len(filters))
+        offset = 0
+        for topic, qos in filters:
+            UINT16.pack_into(out, offset, len(topic))
+            offset += UINT16.size
+            out[offset:offset + len(topic)] = topic
+            offset += len(topic)
+            out[offset] = qos
+            offset += 1
         return out
 
     @classmethod
@@ -38,16 +45,18 @@ class SubscribePayload(MQTTPayload[MQTTVariableHeader]):
             raise ValueError(msg)
 
         payload_length = fixed_header.remaining_length - variable_header.bytes_length
-        read_bytes = 0
-        while read_bytes < payload_length:
+        # read all filters at once; offsets into the buffer track the consumed bytes without re-encoding topics
+        buffer = memoryview(await read_or_raise(reader, payload_length)) if payload_length > 0 else memoryview(b"")
+        offset = 0
+        while offset < len(buffer):
             try:
-                topic = await decode_string(reader)
-                qos_byte = await read_or_raise(reader, 1)
-                qos = bytes_to_int(qos_byte)
-                topics.append((topic, qos))
-                read_bytes += 2 + len(topic.encode("utf-8")) + 1
+                topic, offset = decode_string_from(buffer, offset)
             except NoDataError:
                 break
+            if offset >= len(buffer):
+                break
+            topics.append((topic, buffer[offset]))
+            offset += 1
         return cls(topics)
 
     def __repr__(self) -> str:
@@ -56,6 +65,8 @@ class SubscribePayload(MQTTPayload[MQTTVariableHeader]):
 
 
 class SubscribePacket(MQTTPacket[PacketIdVariableHeader, SubscribePayload, MQTTFixedHeader]):
+    __slots__ = ()
+
     VARIABLE_HEADER = PacketIdVariableHeader
     PAYLOAD = SubscribePayload
 
@@ -2,7 +2,7 @@ from asyncio import StreamReader
 from typing_extensions import Self
 
 from amqtt.adapters import ReaderAdapter
-from amqtt.codecs_amqtt import decode_string, encode_string
+from amqtt.codecs_amqtt import decode_string_from, encode_string_into, read_or_raise
 from amqtt.errors import AMQTTError, NoDataError
 from amqtt.mqtt.packet import UNSUBSCRIBE, MQTTFixedHeader, MQTTPacket, MQTTPayload, MQTTVariableHeader, PacketIdVariableHeader
 
@@ -15,10 +15,10 @@ class UnubscribePayload(MQTTPayload[MQTTVariableHeader]):
         self.topics = topics or []
 
     def to_bytes(self, fixed_header: MQTTFixedHeader | None = None, variable_header: MQTTVariableHeader | None = None) -> bytes:
-        out = b""
+        out = bytearray()
         for topic in self.topics:
-            out += encode_string(topic)
-        return out
+            encode_string_into(out, topic)
+        return bytes(out)
 
     @classmethod
     async def from_stream(
@@ -33,18 +33,21 @@ class UnubscribePayload(MQTTPayload[MQTTVariableHeader]):
 
         topics = []
         payload_length = fixed_header.remaining_length - variable_header.bytes_length
-        read_bytes = 0
-        while read_bytes < payload_length:
+        # read the whole topic list at once and walk it in memory rather than awaiting every length and string
+        buffer = memoryview(await read_or_raise(reader, payload_length)) if payload_length > 0 else memoryview(b"")
+        offset = 0
+        while offset < len(buffer):
             try:
-                topic = await decode_string(reader)
-                topics.append(topic)
-                read_bytes += 2 + len(topic.encode("utf-8"))
+                topic, offset = decode_string_from(buffer, offset)
             except NoDataError:
                 break
+            topics.append(topic)
         return cls(topics)
 
 
 class UnsubscribePacket(MQTTPacket[PacketIdVariableHeader, UnubscribePayload, MQTTFixedHeader]):
+    __slots__ = ()
+
     VARIABLE_HEADER = PacketIdVariableHeader
     PAYLOAD = UnubscribePayload
 
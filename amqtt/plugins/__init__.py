@@ -1,12 +1,12 @@
 """INIT."""
-from typing import Any, Optional, cast
+from typing import Any, cast
 from typing_extensions import Self
 
 
 class TopicMatcher:
     """Singleton class originally provided to optimize topic matching."""
 
-    _instance: Optional["TopicMatcher"] = None
+    _instance: "TopicMatcher | None" = None
 
     def __new__(cls, *args: list[Any], **kwargs: dict[str, Any]) -> Self:
         if cls._instance is None:
@@ -21,7 +21,7 @@ class EventLoggerPlugin(BasePlugin[BaseContext]):
         event_name = kwargs["event_name"].replace("old", "")
         if event_name.replace("on_", "") in (BrokerEvents.CLIENT_CONNECTED, BrokerEvents.CLIENT_DISCONNECTED):
             self.context.logger.info(f"### '{event_name}' EVENT FIRED ###")
-        else:
+        elif self.context.logger.isEnabledFor(logging.DEBUG):
             self.context.logger.debug(f"### '{event_name}' EVENT FIRED ###")
 
     def __getattr__(self, name: str) -> Callable[..., Coroutine[Any, Any, None]]:
@@ -10,7 +10,7 @@ from inspect import iscoroutinefunction
 import logging
 import sys
 import traceback
-from typing import Any, Generic, NamedTuple, Optional, TypeAlias, TypeVar, cast
+from typing import Any, Generic, NamedTuple, TypeAlias, TypeVar, cast
 import warnings
 
 from dacite import Config as DaciteConfig, DaciteError, from_dict
@@ -261,7 +261,7 @@ class PluginManager(Generic[C]):
             self.logger.debug(f"Plugin init failed: {plugin_class.__name__}", exc_info=True)
             raise PluginInitError(plugin_class) from e
 
-    def get_plugin(self, name: str) -> Optional["BasePlugin[C]"]:
+    def get_plugin(self, name: str) -> "BasePlugin[C] | None":
         """Get a plugin by its name from the plugins loaded for the current namespace.
 
         Only used for testing purposes to verify plugin loading correctly.
@@ -357,22 +357,21 @@ class PluginManager(Generic[C]):
         :return: dict containing return from coro call for each plugin.
         """
         tasks: list[asyncio.Future[Any]] = []
+        called_plugins: list[BasePlugin[C]] = []
 
         for plugin in plugins:
-            if not hasattr(plugin, method_name):
+            # one lookup both checks for the method and binds it
+            method = getattr(plugin, method_name, None)
+            if method is None:
                 continue
-
-            async def call_method(p: "BasePlugin[C]", kwargs: dict[str, Any]) -> Any:
-                method = getattr(p, method_name)
-                return await method(**kwargs)
-
-            coro_instance: Awaitable[Any] = call_method(plugin, method_kwargs)
+            coro_instance: Awaitable[Any] = method(**method_kwargs)
             tasks.append(asyncio.ensure_future(coro_instance))
+            called_plugins.append(plugin)
 
         ret_dict: dict[BasePlugin[C], str | bool | None] = {}
         if tasks:
             ret_list = await asyncio.gather(*tasks)
-            ret_dict = dict(zip(plugins, ret_list, strict=False))
+            ret_dict = dict(zip(called_plugins, ret_list, strict=True))
 
         return ret_dict
 
@@ -208,7 +208,8 @@ class BrokerSysPlugin(BasePlugin[BrokerContext]):
     async def on_mqtt_packet_received(self, *, packet: PACKET, session: Session | None = None) -> None:
         """Handle incoming MQTT packets."""
         if packet:
-            packet_size = packet.bytes_length
+            # the header length is known once a packet was read or written, so it is not serialized again to measure it
+            packet_size = packet.fixed_header.bytes_length + packet.fixed_header.remaining_length
             self._stats[STAT_BYTES_RECEIVED] += packet_size
             self._stats[STAT_MSG_RECEIVED] += 1
             if packet.fixed_header.packet_type == PUBLISH:
@@ -217,7 +218,8 @@ class BrokerSysPlugin(BasePlugin[BrokerContext]):
     async def on_mqtt_packet_sent(self, *, packet: PACKET, session: Session | None = None) -> None:
         """Handle sent MQTT packets."""
         if packet:
-            packet_size = packet.bytes_length
+            # the header length is known once a packet was read or written, so it is not serialized again to measure it
+            packet_size = packet.fixed_header.bytes_length + packet.fixed_header.remaining_length
             self._stats[STAT_BYTES_SENT] += packet_size
             self._stats[STAT_MSG_SENT] += 1
             if packet.fixed_header.packet_type == PUBLISH:
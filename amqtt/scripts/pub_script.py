@@ -2,20 +2,18 @@ import asyncio
 from collections.abc import Generator
 import contextlib
 from dataclasses import dataclass
-import json
 import logging
 import os
 from pathlib import Path
 import socket
 import sys
-from typing import Any
 
 import typer
 
 from amqtt import __version__ as amqtt_version
 from amqtt.client import MQTTClient
 from amqtt.errors import ClientError, ConnectError
-from amqtt.utils import read_yaml_config
+from amqtt.utils import parse_extra_headers, read_yaml_config
 
 logger = logging.getLogger(__name__)
 
@@ -26,14 +24,6 @@ def _gen_client_id() -> str:
     return f"amqtt_pub/{pid}-{hostname}"
 
 
-def _get_extra_headers(extra_headers_json: str | None = None) -> dict[str, Any]:
-    try:
-        extra_headers: dict[str, Any] = json.loads(extra_headers_json or "{}")
-    except (json.JSONDecodeError, TypeError):
-        return {}
-    return extra_headers
-
-
 @dataclass
 class MessageInput:
     message_str: str | None = None
@@ -95,7 +85,7 @@ async def do_pub(
             cafile=ca_info.ca_file,
             capath=ca_info.ca_path,
             cadata=ca_info.ca_data,
-            additional_headers=_get_extra_headers(extra_headers_json),
+            additional_headers=parse_extra_headers(extra_headers_json),
         )
 
         for message in message_input.get_message():
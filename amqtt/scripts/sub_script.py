@@ -1,13 +1,11 @@
 import asyncio
 import contextlib
 from dataclasses import dataclass
-import json
 import logging
 import os
 from pathlib import Path
 import socket
 import sys
-from typing import Any
 
 import typer
 
@@ -15,7 +13,7 @@ from amqtt import __version__ as amqtt_version
 from amqtt.client import MQTTClient
 from amqtt.errors import ClientError, ConnectError, MQTTError
 from amqtt.mqtt.constants import QOS_0
-from amqtt.utils import read_yaml_config
+from amqtt.utils import parse_extra_headers, read_yaml_config
 
 logger = logging.getLogger(__name__)
 
@@ -26,14 +24,6 @@ def _gen_client_id() -> str:
     return f"amqtt_sub/{pid}-{hostname}"
 
 
-def _get_extra_headers(extra_headers_json: str | None = None) -> dict[str, Any]:
-    try:
-        extra_headers: dict[str, Any] = json.loads(extra_headers_json or "{}")
-    except (json.JSONDecodeError, TypeError):
-        return {}
-    return extra_headers
-
-
 @dataclass
 class CAInfo:
     ca_file: str | None = None
@@ -60,7 +50,7 @@ async def do_sub(client: MQTTClient,
             cafile=ca_info.ca_file,
             capath=ca_info.ca_path,
             cadata=ca_info.ca_data,
-            additional_headers=_get_extra_headers(extra_headers_json),
+            additional_headers=parse_extra_headers(extra_headers_json),
         )
 
         filters = [(topic, qos) for topic in topics]
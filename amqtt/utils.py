@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from importlib import import_module
+import json
 import logging
 from pathlib import Path
 import secrets
@@ -30,15 +31,31 @@ def format_client_message(
     return "(unknown client)"
 
 
+# Defining a valid set of characters for client ID generation
+_CLIENT_ID_CHARS = string.ascii_letters + string.digits
+_CLIENT_ID_LENGTH = 16
+_CLIENT_ID_SPACE = len(_CLIENT_ID_CHARS) ** _CLIENT_ID_LENGTH
+
+
 def gen_client_id() -> str:
     """Generate a random client ID."""
-    gen_id = "amqtt/"
-
-    # Use secrets to generate a secure random client ID
-    # Defining a valid set of characters for client ID generation
-    valid_chars = string.ascii_letters + string.digits
-    gen_id += "".join(secrets.choice(valid_chars) for _ in range(16))
-    return gen_id
+    # Use secrets to generate a secure random client ID, drawing all of its randomness at once
+    # instead of once per character, then spell that number with the valid characters
+    value = secrets.randbelow(_CLIENT_ID_SPACE)
+    chars = []
+    for _ in range(_CLIENT_ID_LENGTH):
+        value, index = divmod(value, len(_CLIENT_ID_CHARS))
+        chars.append(_CLIENT_ID_CHARS[index])
+    return "amqtt/" + "".join(chars)
+
+
+def parse_extra_headers(extra_headers_json: str | None = None) -> dict[str, Any]:
+    """Parse the extra websocket headers given as JSON on the command line, ignoring invalid input."""
+    try:
+        extra_headers: dict[str, Any] = json.loads(extra_headers_json or "{}")
+    except (json.JSONDecodeError, TypeError):
+        return {}
+    return extra_headers
 
 
 def read_yaml_config(config_file: str | Path) -> dict[str, Any] | None:
@@ -15,6 +15,11 @@ default_factory_map = {
     'default_hash_scheme': default_hash_scheme()
 }
 
+# factory outputs render identically for every field and every rebuild, format them once
+formatted_default_factory_map = {
+    name: pprint.pformat(value, indent=4, width=80, sort_dicts=False) for name, value in default_factory_map.items()
+}
+
 def get_qualified_name(node: ast.AST) -> str | None:
     """Recursively build the qualified name from an AST node."""
     if isinstance(node, ast.Name):
@@ -115,7 +120,8 @@ class DataclassDefaultFactoryExtension(griffe.Extension):
             for kw in node.value.keywords:
                 if kw.arg == "default_factory":
                     # based on the node type, return the proper function name
-                    match get_callable_name(kw.value):
+                    callable_name = get_callable_name(kw.value)
+                    match callable_name:
                         # `dict` and `list` are common default factory functions
                         case 'dict':
                             default_factory_value = "{}"
@@ -124,12 +130,13 @@ class DataclassDefaultFactoryExtension(griffe.Extension):
 
                         case _:
                             # otherwise, see the nodes is in our map for the custom default factory function
-                            callable_name = get_callable_name(kw.value)
-                            if callable_name in default_factory_map:
-                                default_factory_value = pprint.pformat(default_factory_map[callable_name], indent=4, width=80, sort_dicts=False)
+                            if callable_name in formatted_default_factory_map:
+                                default_factory_value = formatted_default_factory_map[callable_name]
                             else:
                                 # if not, display as the default
                                 default_factory_value = f"{callable_name}()"
+                    # a field can only declare `default_factory` once
+                    break
 
             # store the information in the griffe attribute, which is what is passed to the template for rendering
             if "dataclass_ext" not in attr.extra:
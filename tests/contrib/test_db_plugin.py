@@ -5,6 +5,7 @@ from pathlib import Path
 
 import pytest
 import aiosqlite
+from sqlalchemy.ext.asyncio import create_async_engine
 from pwdlib import PasswordHash
 from pwdlib.hashers.argon2 import Argon2Hasher
 from pwdlib.hashers.bcrypt import BcryptHasher
@@ -14,7 +15,7 @@ from amqtt.client import MQTTClient
 from amqtt.contexts import Action
 from amqtt.contrib.auth_db.models import AllowedTopic, PasswordHasher
 from amqtt.contrib.auth_db.plugin import UserAuthDBPlugin, TopicAuthDBPlugin
-from amqtt.contrib.auth_db.managers import UserManager, TopicManager
+from amqtt.contrib.auth_db.managers import TopicRemoval, UserManager, TopicManager
 from amqtt.errors import ConnectError, MQTTError
 from amqtt.mqtt.constants import QOS_1, QOS_0
 from amqtt.session import Session
@@ -350,6 +351,24 @@ async def test_add_topic_to_client(db_file, user_manager, topic_manager, db_conn
         assert user_found
 
 
+@pytest.mark.asyncio
+async def test_managers_share_engine(db_connection):
+    engine = create_async_engine(db_connection)
+    user_manager = UserManager(engine)
+    topic_manager = TopicManager(engine)
+    await user_manager.db_sync()
+
+    await user_manager.create_user_auth("myuser", "mypassword")
+    await topic_manager.create_topic_auth("myuser")
+    await topic_manager.add_allowed_topic("myuser", "my/topic", Action.PUBLISH)
+
+    assert await user_manager.verify_user_auth_password("myuser", "mypassword")
+    topic_auth = await topic_manager.get_topic_auth("myuser")
+    assert topic_auth is not None
+    assert "my/topic" in topic_auth.publish_acl
+    await engine.dispose()
+
+
 @pytest.mark.asyncio
 async def test_invalid_dollar_topic_for_publish(db_file, user_manager, topic_manager, db_connection):
     client_id = "myuser"
@@ -415,6 +434,66 @@ async def test_remove_topic_from_client(db_file, user_manager, topic_manager, db
         assert user_found
 
 
+@pytest.mark.asyncio
+async def test_upsert_topic_for_client(db_file, user_manager, topic_manager, db_connection):
+    client_id = "myuser"
+
+    topic_list = await topic_manager.upsert_allowed_topic(client_id, "my/topic", Action.PUBLISH)
+    assert topic_list == [AllowedTopic("my/topic")]
+
+    topic_list = await topic_manager.upsert_allowed_topic(client_id, "my/other/topic", Action.PUBLISH)
+    assert len(topic_list) == 2
+
+    with pytest.raises(MQTTError):
+        await topic_manager.upsert_allowed_topic(client_id, "my/topic", Action.PUBLISH)
+
+    topic_auth = await topic_manager.get_topic_auth(client_id)
+    assert topic_auth is not None
+    assert len(topic_auth.publish_acl) == 2
+    assert topic_auth.subscribe_acl == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_upsert_topic_for_new_client(db_file, user_manager, topic_manager, db_connection):
+    client_id = "myuser"
+
+    await asyncio.gather(
+        topic_manager.upsert_allowed_topic(client_id, "my/topic", Action.PUBLISH),
+        topic_manager.upsert_allowed_topic(client_id, "my/other/topic", Action.PUBLISH),
+    )
+
+    topic_auth = await topic_manager.get_topic_auth(client_id)
+    assert topic_auth is not None
+    assert sorted(allowed.topic for allowed in topic_auth.publish_acl) == ["my/other/topic", "my/topic"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_upsert_and_remove_topic(db_file, user_manager, topic_manager, db_connection):
+    client_id = "myuser"
+    await topic_manager.upsert_allowed_topic(client_id, "my/topic", Action.PUBLISH)
+    await topic_manager.upsert_allowed_topic(client_id, "my/old/topic", Action.PUBLISH)
+
+    _, removal, _ = await asyncio.gather(
+        topic_manager.upsert_allowed_topic(client_id, "my/other/topic", Action.PUBLISH),
+        topic_manager.try_remove_allowed_topic(client_id, "my/old/topic", Action.PUBLISH),
+        topic_manager.try_remove_allowed_topic(client_id, "my/topic", Action.PUBLISH),
+    )
+    assert removal == TopicRemoval.REMOVED
+
+    topic_auth = await topic_manager.get_topic_auth(client_id)
+    assert topic_auth is not None
+    assert [allowed.topic for allowed in topic_auth.publish_acl] == ["my/other/topic"]
+@pytest.mark.asyncio
+async def test_iter_topic_auths(db_file, user_manager, topic_manager, db_connection):
+    assert [topic_auth async for topic_auth in topic_manager.iter_topic_auths()] == []
+
+    await topic_manager.create_topic_auth("device456")
+    await topic_manager.create_topic_auth("device123")
+
+    usernames = [topic_auth.username async for topic_auth in topic_manager.iter_topic_auths()]
+    assert usernames == ["device123", "device456"]
+
+
 @pytest.mark.asyncio
 async def test_remove_missing_topic(db_file, user_manager, topic_manager, db_connection):
     client_id = "myuser"
@@ -432,6 +511,22 @@ async def test_remove_missing_topic(db_file, user_manager, topic_manager, db_con
         await topic_manager.remove_allowed_topic(client_id, "my/not/topic", Action.PUBLISH)
 
 
+@pytest.mark.asyncio
+async def test_try_remove_topic(db_file, user_manager, topic_manager, db_connection):
+    client_id = "myuser"
+    assert await topic_manager.try_remove_allowed_topic(client_id, "my/topic", Action.PUBLISH) == TopicRemoval.NO_CLIENT
+
+    await topic_manager.create_topic_auth(client_id)
+    await topic_manager.add_allowed_topic(client_id, "my/#", Action.PUBLISH)
+    assert await topic_manager.try_remove_allowed_topic(client_id, "my/topic", Action.PUBLISH) == TopicRemoval.NOT_PRESENT
+    assert await topic_manager.try_remove_allowed_topic(client_id, "my/#", Action.SUBSCRIBE) == TopicRemoval.NOT_PRESENT
+    assert await topic_manager.try_remove_allowed_topic(client_id, "my/#", Action.PUBLISH) == TopicRemoval.REMOVED
+
+    topic_auth = await topic_manager.get_topic_auth(client_id)
+    assert topic_auth is not None
+    assert topic_auth.publish_acl == []
+
+
 @pytest.mark.asyncio
 async def test_remove_topic_wrong_action(db_file, user_manager, topic_manager, db_connection):
     client_id = "myuser"
@@ -115,6 +115,25 @@ def test_cli_mgr_sync(db_file, app, error_msg, caplog):
         assert "Success: database synced." in caplog.text
 
 
+def test_topic_mgr_subcommand_help_skips_db():
+    # requesting help shouldn't prompt for the db password or connect to the db
+    result = runner.invoke(topic_app, ["-d", "mysql", "-u", "mydbname", "list", "--help"])
+    assert result.exit_code == 0, f"{result.output}"
+    assert "Enter the db password" not in strip_ansi_codes(result.output)
+
+
+def test_topic_mgr_db_unreachable(caplog):
+    with caplog.at_level(logging.INFO), tempfile.TemporaryDirectory() as temp_dir:
+        # sqlite can't open a directory as a database file
+        result = runner.invoke(topic_app, [
+            "-d", "sqlite",
+            "-f", temp_dir,
+            "list"
+        ])
+        assert result.exit_code == 1
+        assert "Could not connect to the database" in caplog.text
+
+
 @pytest.mark.parametrize("app,success_msg", [
     (user_app, "authentications"),
     (topic_app, "authorizations"),
@@ -252,6 +271,26 @@ def test_add_allowed_topic(db_file, topic_manager, caplog):
     asyncio.run(verify_add())
 
 
+def test_add_allowed_topic_duplicate(db_file, topic_manager, caplog):
+    async def init_topic_auths():
+        await topic_manager.create_topic_auth('client123')
+        await topic_manager.add_allowed_topic('client123', 'my/topic', Action.PUBLISH)
+
+    asyncio.run(init_topic_auths())
+
+    with caplog.at_level(logging.INFO):
+        result = runner.invoke(topic_app, [
+            "-d", "sqlite",
+            "-f", f"{db_file}",
+            "add",
+            "-c", "client123",
+            "-a", "publish",
+            "my/topic"
+        ])
+        assert result.exit_code == 1
+        assert "Topic 'my/topic' already exists for 'publish'." in caplog.text
+
+
 def test_remove_user_auth_mismatch(db_file, user_manager, caplog):
     async def init_user_auths():
         await user_manager.create_user_auth("client123", "randompassword")
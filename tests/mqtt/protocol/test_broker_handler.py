@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from amqtt.adapters import BufferWriter
+from amqtt.events import MQTTEvents
+from amqtt.mqtt.pingreq import PingReqPacket
+from amqtt.mqtt.pingresp import PingRespPacket
+from amqtt.mqtt.protocol.broker_handler import BrokerProtocolHandler, Subscription, UnSubscription
+from amqtt.mqtt.subscribe import SubscribePacket
+from amqtt.mqtt.unsubscribe import UnsubscribePacket
+from amqtt.plugins.manager import PluginManager
+from amqtt.session import Session
+
+
+@pytest.mark.asyncio
+async def test_pending_subscriptions_in_order():
+    handler = BrokerProtocolHandler(PluginManager("amqtt.test.plugins", context=None))
+
+    waiter = asyncio.ensure_future(handler.get_next_pending_subscription())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await handler.handle_subscribe(SubscribePacket.build([("a/b", 1)], 1))
+    await handler.handle_subscribe(SubscribePacket.build([("c/d", 0)], 2))
+    assert (await waiter).packet_id == 1
+    subscription = await handler.get_next_pending_subscription()
+    assert subscription.packet_id == 2
+    assert subscription.topics == [("c/d", 0)]
+
+
+@pytest.mark.asyncio
+async def test_stop_clears_pending_unsubscriptions():
+    handler = BrokerProtocolHandler(PluginManager("amqtt.test.plugins", context=None))
+    await handler.handle_unsubscribe(UnsubscribePacket.build(["a/b"], 1))
+    await handler.stop()
+
+    waiter = asyncio.ensure_future(handler.get_next_pending_unsubscription())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    await handler.handle_unsubscribe(UnsubscribePacket.build(["c/d"], 2))
+    assert (await waiter).topics == ["c/d"]
+
+
+def test_pending_requests_have_no_dict():
+    assert not hasattr(Subscription(1, [("a/b", 0)]), "__dict__")
+    assert not hasattr(UnSubscription(1, ["a/b"]), "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_pending_subscription_filters_interned():
+    handler = BrokerProtocolHandler(PluginManager("amqtt.test.plugins", context=None))
+    topic = "".join(["sensors/", "+/temperature"])
+    await handler.handle_subscribe(SubscribePacket.build([(topic, 1)], 1))
+    await handler.handle_subscribe(SubscribePacket.build([("".join(["sensors/", "+/temperature"]), 0)], 2))
+
+    first = await handler.get_next_pending_subscription()
+    second = await handler.get_next_pending_subscription()
+    assert first.topics[0][0] is second.topics[0][0]
+    assert second.topics == [("sensors/+/temperature", 0)]
+
+
+@pytest.mark.asyncio
+async def test_pingreq_answered_with_fresh_pingresp():
+    handler = BrokerProtocolHandler(PluginManager("amqtt.test.plugins", context=None))
+    writer = BufferWriter()
+    handler.attach(Session(), None, writer)
+    sent = []
+
+    async def record(event_name, *args, packet=None, **kwargs):
+        if event_name == MQTTEvents.PACKET_SENT:
+            sent.append(packet)
+
+    handler.plugins_manager.fire_event = record
+
+    await handler.handle_pingreq(PingReqPacket())
+    await handler.handle_pingreq(PingReqPacket())
+
+    assert writer.get_buffer() == b"\xd0\x00\xd0\x00"
+    assert [type(packet) for packet in sent] == [PingRespPacket, PingRespPacket]
+    assert sent[0] is not sent[1]
+    assert sent[0].protocol_ts is not None
+    assert sent[1].protocol_ts is not None
@@ -0,0 +1,155 @@
+import asyncio
+
+import pytest
+
+from amqtt.adapters import BufferWriter
+from amqtt.events import MQTTEvents
+from amqtt.mqtt.disconnect import DisconnectPacket
+from amqtt.mqtt.pingreq import PingReqPacket
+from amqtt.mqtt.pingresp import PingRespPacket
+from amqtt.mqtt.protocol.client_handler import ClientProtocolHandler
+from amqtt.plugins.manager import PluginManager
+from amqtt.session import Session
+
+
+@pytest.fixture
+def client_session():
+    session = Session()
+    session.client_id = "client1"
+    session.keep_alive = 30
+    session.clean_session = True
+    return session
+
+
+@pytest.mark.asyncio
+async def test_build_connect_packet_minimal(client_session):
+    handler = ClientProtocolHandler(PluginManager("amqtt.test.plugins", context=None), session=client_session)
+
+    connect = handler._build_connect_packet()
+    assert connect.variable_header.flags == 0x02
+    assert connect.keep_alive == 30
+    assert connect.client_id == "client1"
+    assert connect.username is None
+    assert connect.will_topic is None
+
+
+@pytest.mark.asyncio
+async def test_build_connect_packet_all_flags(client_session):
+    client_session.username = "user"
+    client_session.password = "password"
+    client_session.will_flag = True
+    client_session.will_qos = 2
+    client_session.will_retain = True
+    client_session.will_topic = "will/topic"
+    client_session.will_message = b"bye"
+    handler = ClientProtocolHandler(PluginManager("amqtt.test.plugins", context=None), session=client_session)
+
+    connect = handler._build_connect_packet()
+    assert connect.username_flag
+    assert connect.password_flag
+    assert connect.will_flag
+    assert connect.will_retain_flag
+    assert connect.clean_session_flag
+    assert connect.will_qos == 2
+    assert not connect.reserved_flag
+    assert connect.variable_header.flags == 0xF6
+    assert connect.username == "user"
+    assert connect.password == "password"
+    assert connect.will_topic == "will/topic"
+    assert connect.will_message == b"bye"
+
+
+@pytest.mark.asyncio
+async def test_pingresp_wakes_concurrent_pings(client_session):
+    handler = ClientProtocolHandler(PluginManager("amqtt.test.plugins", context=None), session=client_session)
+
+    pings = [asyncio.ensure_future(handler.mqtt_ping()) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    assert not any(ping.done() for ping in pings)
+
+    pingresp = PingRespPacket()
+    await handler.handle_pingresp(pingresp)
+    assert await asyncio.wait_for(asyncio.gather(*pings), 1) == [pingresp, pingresp]
+
+
+@pytest.mark.asyncio
+async def test_ping_ignores_stale_pingresp(client_session):
+    handler = ClientProtocolHandler(PluginManager("amqtt.test.plugins", context=None), session=client_session)
+    await handler.handle_pingresp(PingRespPacket())
+
+    ping = asyncio.ensure_future(handler.mqtt_ping())
+    await asyncio.sleep(0.01)
+    assert not ping.done()
+    await handler.handle_pingresp(PingRespPacket())
+    await asyncio.wait_for(ping, 1)
+
+
+@pytest.mark.asyncio
+async def test_subscribe_waiter_removed_on_cancel(client_session):
+    handler = ClientProtocolHandler(PluginManager("amqtt.test.plugins", context=None), session=client_session)
+
+    subscribe = asyncio.ensure_future(handler.mqtt_subscribe([("a/b", 1)], 1))
+    await asyncio.sleep(0.01)
+    assert 1 in handler._subscriptions_waiter
+    subscribe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await subscribe
+    assert handler._subscriptions_waiter == {}
+
+
+@pytest.mark.asyncio
+async def test_replaced_waiter_is_kept(client_session):
+    handler = ClientProtocolHandler(PluginManager("amqtt.test.plugins", context=None), session=client_session)
+
+    stale = handler._add_waiter(handler._subscriptions_waiter, 1)
+    current = handler._add_waiter(handler._subscriptions_waiter, 1)
+    stale.cancel()
+    await asyncio.sleep(0)
+    assert handler._subscriptions_waiter == {1: current}
+    current.set_result([1])
+    await asyncio.sleep(0)
+    assert handler._subscriptions_waiter == {}
+
+
+@pytest.mark.asyncio
+async def test_write_timeout_schedules_one_ping(client_session):
+    handler = ClientProtocolHandler(PluginManager("amqtt.test.plugins", context=None), session=client_session)
+
+    handler.handle_write_timeout()
+    ping_task = handler._ping_task
+    handler.handle_write_timeout()
+    assert handler._ping_task is ping_task
+
+    await asyncio.sleep(0.01)
+    await handler.handle_pingresp(PingRespPacket())
+    await asyncio.wait_for(ping_task, 1)
+    handler.handle_write_timeout()
+    assert handler._ping_task is not ping_task
+    handler._ping_task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_pings_and_disconnects_send_fresh_packets(client_session):
+    handler = ClientProtocolHandler(PluginManager("amqtt.test.plugins", context=None), session=client_session)
+    writer = BufferWriter()
+    handler.writer = writer
+    sent = []
+
+    async def record(event_name, *args, packet=None, **kwargs):
+        if event_name == MQTTEvents.PACKET_SENT:
+            sent.append(packet)
+
+    handler.plugins_manager.fire_event = record
+
+    for _ in range(2):
+        ping = asyncio.ensure_future(handler.mqtt_ping())
+        await asyncio.sleep(0.01)
+        await handler.handle_pingresp(PingRespPacket())
+        await asyncio.wait_for(ping, 1)
+    await handler.mqtt_disconnect()
+    await handler.mqtt_disconnect()
+
+    assert writer.get_buffer() == b"\xc0\x00\xc0\x00\xe0\x00\xe0\x00"
+    assert [type(packet) for packet in sent] == [PingReqPacket, PingReqPacket, DisconnectPacket, DisconnectPacket]
+    assert len({id(packet) for packet in sent}) == 4
+    assert all(packet.protocol_ts is not None for packet in sent)
@@ -5,8 +5,10 @@ from typing import Any
 import unittest
 
 from amqtt.adapters import StreamReaderAdapter, StreamWriterAdapter
+from amqtt.errors import AMQTTError
 from amqtt.mqtt.constants import QOS_0, QOS_1, QOS_2
-from amqtt.mqtt.protocol.handler import ProtocolHandler
+from amqtt.mqtt.packet import CONNECT
+from amqtt.mqtt.protocol.handler import _PACKET_HANDLERS, ProtocolHandler
 from amqtt.mqtt.puback import PubackPacket
 from amqtt.mqtt.pubcomp import PubcompPacket
 from amqtt.mqtt.publish import PublishPacket
@@ -538,3 +540,60 @@ class ProtocolHandlerTest(unittest.TestCase):
         exception = future.exception()
         if exception:
             raise exception
+
+
+def test_packet_handlers_resolve():
+    for handler_name in _PACKET_HANDLERS.values():
+        assert asyncio.iscoroutinefunction(getattr(ProtocolHandler, handler_name))
+    assert CONNECT not in _PACKET_HANDLERS
+
+
+async def test_read_timeout_without_data():
+    class TimeoutHandler(ProtocolHandler):
+        read_timeouts = 0
+
+        def handle_read_timeout(self) -> None:
+            self.read_timeouts += 1
+
+    session = Session()
+    session.client_id = "read-timeout"
+    session.keep_alive = 1
+    reader = asyncio.StreamReader()
+    handler = TimeoutHandler(PluginManager("amqtt.test.plugins", context=None), loop=asyncio.get_running_loop())
+    handler.attach(session, StreamReaderAdapter(reader), None)
+    await handler.start()
+
+    await asyncio.sleep(1.2)
+    assert handler.read_timeouts == 1
+    # the timeout does not stop the reader, which still gets the next packet
+    assert not handler._reader_task.done()
+
+    reader.feed_eof()
+    await asyncio.wait_for(handler._reader_stopped.wait(), 1)
+    assert handler._read_timeout_task is None
+    await handler.stop()
+
+
+async def test_read_timeout_rearmed_after_error():
+    class FailingTimeoutHandler(ProtocolHandler):
+        read_timeouts = 0
+
+        def handle_read_timeout(self) -> None:
+            self.read_timeouts += 1
+            raise AMQTTError("read timeout handling failed")
+
+    session = Session()
+    session.client_id = "read-timeout-error"
+    session.keep_alive = 1
+    reader = asyncio.StreamReader()
+    handler = FailingTimeoutHandler(PluginManager("amqtt.test.plugins", context=None), loop=asyncio.get_running_loop())
+    handler.attach(session, StreamReaderAdapter(reader), None)
+    await handler.start()
+
+    await asyncio.sleep(1.2)
+    assert handler.read_timeouts == 1
+    # the failed check still scheduled the next one
+    assert handler._read_timeout_task.when() > asyncio.get_running_loop().time()
+
+    await handler.stop()
+    assert handler._read_timeout_task is None
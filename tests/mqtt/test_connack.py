@@ -1,10 +1,10 @@
 import pytest
+from amqtt.adapters import BufferReader
 from amqtt.errors import AMQTTError
-from amqtt.mqtt.connack import ConnackPacket
+from amqtt.mqtt.connack import BAD_USERNAME_PASSWORD, CONNECTION_ACCEPTED, ConnackPacket, ConnackVariableHeader
 from amqtt.mqtt.packet import MQTTFixedHeader, PUBLISH
 
 
-
 def test_incorrect_fixed_header():
     header = MQTTFixedHeader(PUBLISH, 0x00)
     with pytest.raises(AMQTTError):
@@ -23,3 +23,33 @@ def test_empty_variable_header(prop):
 
     with pytest.raises(ValueError):
         assert setattr(packet, prop, "a value")
+
+
+@pytest.mark.parametrize("session_parent,return_code,data", [
+    (0, CONNECTION_ACCEPTED, b"\x00\x00"),
+    (1, CONNECTION_ACCEPTED, b"\x01\x00"),
+    (1, BAD_USERNAME_PASSWORD, b"\x01\x04"),
+    (None, None, b"\x00\x00"),
+])
+def test_variable_header_to_bytes(session_parent, return_code, data):
+    header = ConnackVariableHeader(session_parent, return_code)
+    assert header.to_bytes() == data
+
+
+def test_to_bytes():
+    packet = ConnackPacket.build(1, BAD_USERNAME_PASSWORD)
+    assert packet.to_bytes() == b"\x20\x02\x01\x04"
+
+
+async def test_from_stream():
+    stream = BufferReader(b"\x20\x02\x01\x04")
+    packet = await ConnackPacket.from_stream(stream)
+    assert packet.session_parent == 1
+    assert packet.return_code == BAD_USERNAME_PASSWORD
+
+
+def test_variable_header_slots():
+    header = ConnackVariableHeader(1, CONNECTION_ACCEPTED)
+    assert not hasattr(header, "__dict__")
+    with pytest.raises(AttributeError):
+        header.mqtt5 = True
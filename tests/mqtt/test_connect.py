@@ -83,6 +83,24 @@ class ConnectPacketTest(unittest.TestCase):
         assert message.payload is not None
         assert message.payload.will_topic is None
 
+    def test_decode_single_read(self):
+        class CountingReader(BufferReader):
+            reads = 0
+
+            async def read(self, n: int = -1) -> bytes:
+                self.reads += 1
+                return await super().read(n)
+
+        data = (
+            b"\x10\x3e\x00\x04MQTT\x04\xce\x00\x00\x00\x0a0123456789"
+            b"\x00\x09WillTopic\x00\x0bWillMessage\x00\x04user\x00\x08password"
+        )
+        stream = CountingReader(data)
+        message = self.loop.run_until_complete(ConnectPacket.from_stream(stream))
+        assert message.payload.password == "password"
+        # two reads for the fixed header, one for the rest of the packet
+        assert stream.reads == 3
+
     def test_decode_fail_miss_username(self):
         data = b"\x10\x2e\x00\x04MQTT\x04\xce\x00\x00\x00\x0a0123456789\x00\x09WillTopic\x00\x0bWillMessage"
         stream = BufferReader(data)
@@ -185,3 +203,90 @@ def test_empty_variable_header(prop):
     with pytest.raises(ValueError):
         assert setattr(packet, prop, "a value")
 
+
+
+@pytest.mark.parametrize("prop,mask", [
+    ("username_flag", ConnectVariableHeader.USERNAME_FLAG),
+    ("password_flag", ConnectVariableHeader.PASSWORD_FLAG),
+    ("will_retain_flag", ConnectVariableHeader.WILL_RETAIN_FLAG),
+    ("will_flag", ConnectVariableHeader.WILL_FLAG),
+    ("clean_session_flag", ConnectVariableHeader.CLEAN_SESSION_FLAG),
+    ("reserved_flag", ConnectVariableHeader.RESERVED_FLAG),
+])
+def test_flag_setters(prop, mask):
+    variable_header = ConnectVariableHeader(0xFF & ~mask)
+    setattr(variable_header, prop, True)
+    assert getattr(variable_header, prop) is True
+    assert variable_header.flags == 0xFF
+
+    setattr(variable_header, prop, False)
+    assert getattr(variable_header, prop) is False
+    assert variable_header.flags == 0xFF & ~mask
+
+
+def test_will_qos_setter():
+    variable_header = ConnectVariableHeader(0xFF)
+    variable_header.will_qos = 2
+    assert variable_header.will_qos == 2
+    assert variable_header.flags == 0xF7
+
+
+@pytest.mark.asyncio
+async def test_variable_header_from_stream():
+    stream = BufferReader(b"\x00\x04MQTT\x04\xce\x01\x2c")
+    variable_header = await ConnectVariableHeader.from_stream(stream, None)
+    assert variable_header.proto_name == "MQTT"
+    assert variable_header.proto_level == 4
+    assert variable_header.flags == 0xCE
+    assert variable_header.keep_alive == 300
+    assert variable_header.to_bytes() == b"\x00\x04MQTT\x04\xce\x01\x2c"
+
+
+def test_payload_to_bytes_only_flagged_fields():
+    variable_header = ConnectVariableHeader(ConnectVariableHeader.USERNAME_FLAG)
+    payload = ConnectPayload("client", "WillTopic", b"WillMessage", "usér", "password")
+    assert payload.to_bytes(None, variable_header) == b"\x00\x06client\x00\x05us\xc3\xa9r"
+
+
+def test_variable_header_other_proto_name():
+    variable_header, offset = ConnectVariableHeader.from_bytes(b"\x00\x06MQIsdp\x03\x02\x00\x3c")
+    assert variable_header.proto_name == "MQIsdp"
+    assert variable_header.proto_level == 3
+    assert offset == 12
+    assert variable_header.to_bytes() == b"\x00\x06MQIsdp\x03\x02\x00\x3c"
+
+
+def test_variable_header_to_bytes_type():
+    assert type(ConnectVariableHeader(0x02, 60).to_bytes()) is bytes
+
+
+@pytest.mark.parametrize("prop", [
+    "username_flag",
+    "password_flag",
+    "clean_session_flag",
+    "will_retain_flag",
+    "will_flag",
+    "reserved_flag",
+])
+def test_packet_flag_accessors(prop):
+    packet = ConnectPacket(variable_header=ConnectVariableHeader(), payload=ConnectPayload())
+    setattr(packet, prop, True)
+    assert getattr(packet, prop) is True
+    assert getattr(packet.variable_header, prop) is True
+
+    setattr(packet, prop, False)
+    assert getattr(packet, prop) is False
+    assert packet.variable_header.flags == 0x00
+
+
+@pytest.mark.asyncio
+async def test_payload_from_stream_matches_from_bytes():
+    body = b"\x00\x0a0123456789\x00\x09WillTopic\x00\x0bWillMessage\x00\x04user\x00\x08password"
+    variable_header = ConnectVariableHeader(0xCE, 0)
+    fixed_header = MQTTFixedHeader(CONNECT, 0x00, variable_header.bytes_length + len(body))
+    message = await ConnectPacket.from_stream(BufferReader(body), fixed_header, variable_header)
+    expected = ConnectPayload.from_bytes(body, 0, variable_header)
+
+    for field in ("client_id", "will_topic", "will_message", "username", "password"):
+        assert getattr(message.payload, field) == getattr(expected, field)
+    assert message.payload.will_message == b"WillMessage"
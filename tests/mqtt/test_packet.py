@@ -4,8 +4,11 @@ import unittest
 import pytest
 
 from amqtt.adapters import BufferReader
-from amqtt.errors import MQTTError
-from amqtt.mqtt.packet import CONNECT, MQTTFixedHeader
+from amqtt.errors import AMQTTError, MQTTError
+from amqtt.mqtt import packet_class
+from amqtt.mqtt.connect import ConnectPacket
+from amqtt.mqtt.disconnect import DisconnectPacket
+from amqtt.mqtt.packet import CONNECT, DISCONNECT, RESERVED_0, RESERVED_15, MQTTFixedHeader, PacketIdVariableHeader
 
 
 class TestMQTTFixedHeaderTest(unittest.TestCase):
@@ -59,3 +62,29 @@ class TestMQTTFixedHeaderTest(unittest.TestCase):
         header = MQTTFixedHeader(CONNECT, 0x00, 268435455)
         data = header.to_bytes()
         assert data == b"\x10\xff\xff\xff\x7f"
+
+    def test_to_bytes_single_byte_length_boundary(self):
+        assert MQTTFixedHeader(CONNECT, 0x00, 127).to_bytes() == b"\x10\x7f"
+        assert MQTTFixedHeader(CONNECT, 0x00, 128).to_bytes() == b"\x10\x80\x01"
+
+
+@pytest.mark.parametrize("packet_type", [RESERVED_0, RESERVED_15, 16, -1])
+def test_packet_class_rejects_unknown_type(packet_type):
+    with pytest.raises(AMQTTError):
+        packet_class(MQTTFixedHeader(packet_type))
+
+
+def test_packet_class():
+    assert packet_class(MQTTFixedHeader(CONNECT)) is ConnectPacket
+    assert packet_class(MQTTFixedHeader(DISCONNECT)) is DisconnectPacket
+
+
+def test_packet_id_variable_header_bytes_length():
+    header = PacketIdVariableHeader(0xFFFF)
+    assert header.bytes_length == len(header.to_bytes()) == 2
+
+
+@pytest.mark.parametrize("remaining_length", [0, 127, 128, 16383, 16384, 2097151, 2097152, 268435455])
+def test_fixed_header_bytes_length(remaining_length):
+    header = MQTTFixedHeader(CONNECT, 0x00, remaining_length)
+    assert header.bytes_length == len(header.to_bytes())
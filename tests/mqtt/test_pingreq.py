@@ -0,0 +1,31 @@
+import asyncio
+import unittest
+
+import pytest
+
+from amqtt.adapters import BufferReader
+from amqtt.errors import AMQTTError
+from amqtt.mqtt import MQTTFixedHeader, PUBLISH, PINGREQ
+from amqtt.mqtt.pingreq import PingReqPacket
+
+
+class PingReqPacketTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def test_from_stream(self):
+        data = b"\xc0\x00"
+        stream = BufferReader(data)
+        message = self.loop.run_until_complete(PingReqPacket.from_stream(stream))
+        assert message.fixed_header.packet_type == PINGREQ
+
+    def test_to_bytes(self):
+        out = PingReqPacket().to_bytes()
+        assert out == b"\xc0\x00"
+        assert out == MQTTFixedHeader(PINGREQ, 0x00).to_bytes()
+
+
+def test_incorrect_fixed_header():
+    header = MQTTFixedHeader(PUBLISH, 0x00)
+    with pytest.raises(AMQTTError):
+        _ = PingReqPacket(fixed=header)
@@ -0,0 +1,31 @@
+import asyncio
+import unittest
+
+import pytest
+
+from amqtt.adapters import BufferReader
+from amqtt.errors import AMQTTError
+from amqtt.mqtt import MQTTFixedHeader, PUBLISH, PINGRESP
+from amqtt.mqtt.pingresp import PingRespPacket
+
+
+class PingRespPacketTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def test_from_stream(self):
+        data = b"\xd0\x00"
+        stream = BufferReader(data)
+        message = self.loop.run_until_complete(PingRespPacket.from_stream(stream))
+        assert message.fixed_header.packet_type == PINGRESP
+
+    def test_to_bytes(self):
+        out = PingRespPacket().to_bytes()
+        assert out == b"\xd0\x00"
+        assert out == MQTTFixedHeader(PINGRESP, 0x00).to_bytes()
+
+
+def test_incorrect_fixed_header():
+    header = MQTTFixedHeader(PUBLISH, 0x00)
+    with pytest.raises(AMQTTError):
+        _ = PingRespPacket(fixed=header)
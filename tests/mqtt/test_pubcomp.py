@@ -3,7 +3,7 @@ import unittest
 import pytest
 
 from amqtt.adapters import BufferReader
-from amqtt.errors import AMQTTError
+from amqtt.errors import AMQTTError, MQTTError
 from amqtt.mqtt import MQTTFixedHeader, PUBLISH
 from amqtt.mqtt.pubcomp import PacketIdVariableHeader, PubcompPacket
 
@@ -18,11 +18,24 @@ class PubcompPacketTest(unittest.TestCase):
         message = self.loop.run_until_complete(PubcompPacket.from_stream(stream))
         assert message.variable_header.packet_id == 10
 
+    def test_from_stream_too_long(self):
+        # reason code and empty property length after the packet id are not MQTT 3.1.1
+        stream = BufferReader(b"\x70\x04\x00\x0a\x00\x00")
+        with pytest.raises(MQTTError):
+            self.loop.run_until_complete(PubcompPacket.from_stream(stream))
+
+    def test_from_stream_too_short(self):
+        stream = BufferReader(b"\x70\x01\x00")
+        with pytest.raises(MQTTError):
+            self.loop.run_until_complete(PubcompPacket.from_stream(stream))
+
     def test_to_bytes(self):
         variable_header = PacketIdVariableHeader(10)
         publish = PubcompPacket(variable_header=variable_header)
         out = publish.to_bytes()
         assert out == b"p\x02\x00\n"
+        assert publish.fixed_header.remaining_length == 2
+        assert PubcompPacket.build(0xFFFF).to_bytes() == b"p\x02\xff\xff"
 
 def test_incorrect_fixed_header():
     header = MQTTFixedHeader(PUBLISH, 0x00)
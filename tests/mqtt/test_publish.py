@@ -2,9 +2,9 @@ import asyncio
 import unittest
 import pytest
 
-from amqtt.adapters import BufferReader
+from amqtt.adapters import BufferReader, BufferWriter
 from amqtt.errors import AMQTTError
-from amqtt.mqtt.packet import MQTTFixedHeader, CONNECT
+from amqtt.mqtt.packet import MQTTFixedHeader, CONNECT, PUBLISH
 from amqtt.mqtt.constants import QOS_0, QOS_1, QOS_2
 from amqtt.mqtt.publish import PublishPacket, PublishPayload, PublishVariableHeader
 
@@ -33,6 +33,22 @@ class PublishPacketTest(unittest.TestCase):
         assert message.fixed_header.flags & 0x01
         assert message.payload.data, b"0123456789"
 
+    def test_variable_header_from_stream_reads(self):
+        class CountingReader(BufferReader):
+            reads = 0
+
+            async def read(self, n: int = -1) -> bytes:
+                self.reads += 1
+                return await super().read(n)
+
+        stream = CountingReader(b"\x00\x05topic\x00\x0a")
+        fixed_header = MQTTFixedHeader(PUBLISH, 0x02, 9)
+        header = self.loop.run_until_complete(PublishVariableHeader.from_stream(stream, fixed_header))
+        assert header.topic_name == "topic"
+        assert header.packet_id == 10
+        # one read for the topic length, one for the topic name and packet id
+        assert stream.reads == 2
+
     def test_to_stream_no_packet_id(self):
         variable_header = PublishVariableHeader("topic", None)
         payload = PublishPayload(b"0123456789")
@@ -47,6 +63,47 @@ class PublishPacketTest(unittest.TestCase):
         out = publish.to_bytes()
         assert out == b"0\x13\x00\x05topic\x00\n0123456789"
 
+    def test_to_stream_writes_segments(self):
+        class RecordingWriter(BufferWriter):
+            def __init__(self):
+                super().__init__()
+                self.write_calls = 0
+
+            def write(self, data):
+                self.write_calls += 1
+                super().write(data)
+
+        writer = RecordingWriter()
+        publish = PublishPacket.build("topic", b"0123456789", 10, False, QOS_1, False)
+        self.loop.run_until_complete(publish.to_stream(writer))
+        assert writer.get_buffer() == b"2\x13\x00\x05topic\x00\n0123456789"
+        # fixed header, variable header and payload are handed over without being joined first
+        assert writer.write_calls == 3
+        assert publish.protocol_ts is not None
+
+    def test_variable_header_to_bytes_multibyte_topic(self):
+        out = PublishVariableHeader("t\u00e9", 10).to_bytes()
+        assert out == b"\x00\x03t\xc3\xa9\x00\n"
+
+    def test_variable_header_to_bytes_reuses_topic_encoding(self):
+        first = PublishVariableHeader("cached/topic", None).to_bytes()
+        second = PublishVariableHeader("cached/topic", 11).to_bytes()
+        assert first == b"\x00\x0ccached/topic"
+        assert second == first + b"\x00\x0b"
+        assert first is PublishVariableHeader("cached/topic").to_bytes()
+
+    def test_variable_header_keeps_received_topic_bytes(self):
+        data = b"\x32\x0b\x00\x05t\xc3\xa9/a\x00\x0a12"
+        message = self.loop.run_until_complete(PublishPacket.from_stream(BufferReader(data)))
+        header = message.variable_header
+        assert header.bytes_length == 9
+        assert header.to_bytes() == data[2:11]
+        assert message.payload.data == b"12"
+
+        message.topic_name = "other"
+        assert header.bytes_length == 9
+        assert header.to_bytes() == b"\x00\x05other\x00\x0a"
+
     def test_build(self):
         packet = PublishPacket.build("/topic", b"data", 1, False, QOS_0, False)
         assert packet.packet_id == 1
@@ -129,6 +186,12 @@ def test_incorrect_fixed_header():
 def test_set_flags():
     packet = PublishPacket()
     packet.set_flags(dup_flag=True, qos=QOS_1, retain_flag=True)
+    assert packet.fixed_header.flags == 0x0B
+    packet.set_flags(qos=QOS_2)
+    assert packet.fixed_header.flags == 0x04
+    packet.retain_flag = True
+    packet.dup_flag = False
+    assert packet.fixed_header.flags == 0x05
 
 
 @pytest.mark.parametrize("prop", [
@@ -144,3 +207,18 @@ def test_empty_variable_header(prop):
 
     with pytest.raises(ValueError):
         assert setattr(packet, prop, "a value")
+
+
+@pytest.mark.asyncio
+async def test_payload_from_stream_keeps_read_buffer():
+    payload_bytes = b"x" * 1024
+
+    class SingleBufferReader(BufferReader):
+        async def read(self, n=-1):
+            if n == len(payload_bytes):
+                return payload_bytes
+            return await super().read(n)
+
+    data = b"\x30\x87\x08\x00\x05topic"
+    message = await PublishPacket.from_stream(SingleBufferReader(data))
+    assert message.data is payload_bytes
@@ -32,3 +32,23 @@ class SubackPacketTest(unittest.TestCase):
         suback = SubackPacket(variable_header=variable_header, payload=payload)
         out = suback.to_bytes()
         assert out == b"\x90\x06\x00\n\x00\x01\x02\x80"
+
+    def test_from_stream_reads_return_codes_once(self):
+        class CountingReader(BufferReader):
+            reads = 0
+
+            async def read(self, n=-1):
+                self.reads += 1
+                return await super().read(n)
+
+        stream = CountingReader(b"\x90\x06\x00\x0a\x00\x01\x02\x80")
+        message = self.loop.run_until_complete(SubackPacket.from_stream(stream))
+        assert message.payload.return_codes == b"\x00\x01\x02\x80"
+        # type byte, remaining length, packet id, return codes
+        assert stream.reads == 4
+
+    def test_payload_keeps_codes_as_bytes(self):
+        payload = SubackPayload([SubackPayload.RETURN_CODE_01, SubackPayload.RETURN_CODE_80])
+        assert payload.return_codes == b"\x01\x80"
+        assert payload.to_bytes() is payload.return_codes
+        assert SubackPayload().to_bytes() == b""
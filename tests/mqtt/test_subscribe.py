@@ -28,3 +28,14 @@ class SubscribePacketTest(unittest.TestCase):
         publish = SubscribePacket(variable_header=variable_header, payload=payload)
         out = publish.to_bytes()
         assert out == b"\x82\x0e\x00\n\x00\x03a/b\x01\x00\x03c/d\x02"
+
+    def test_payload_to_bytes_multibyte_filter(self):
+        assert SubscribePayload([("té/#", QOS_1)]).to_bytes() == b"\x00\x05t\xc3\xa9/#\x01"
+        assert SubscribePayload().to_bytes() == b""
+
+    def test_from_stream_multibyte_and_truncated_filter(self):
+        # the filter length counts encoded bytes; the last filter is missing its QoS byte
+        data = b"\x82\x0e\x00\x0a\x00\x04t\xc3\xa9/\x01\x00\x03c/d"
+        stream = BufferReader(data)
+        message = self.loop.run_until_complete(SubscribePacket.from_stream(stream))
+        assert message.payload.topics == [("té/", QOS_1)]
@@ -23,3 +23,10 @@ class UnsubscribePacketTest(unittest.TestCase):
         publish = UnsubscribePacket(variable_header=variable_header, payload=payload)
         out = publish.to_bytes()
         assert out == b"\xa2\x0c\x00\n\x00\x03a/b\x00\x03c/d"
+
+    def test_from_stream_truncated_topic(self):
+        # the second topic claims more bytes than remain in the packet
+        data = b"\xa2\x0a\x00\n\x00\x03a/b\x00\x05c/"
+        stream = BufferReader(data)
+        message = self.loop.run_until_complete(UnsubscribePacket.from_stream(stream))
+        assert message.payload.topics == ["a/b"]
@@ -106,3 +106,10 @@ class TestPluginManager(unittest.TestCase):
         plugin = manager.get_plugin("EventTestPlugin")
         assert plugin is not None
         assert plugin.test_topic_flag
+
+    def test_map_plugin_method_skips_plugins_without_method(self) -> None:
+        plugin = EventTestPlugin(BaseContext())
+        ret = self.loop.run_until_complete(
+            PluginManager._map_plugin_method([EmptyTestPlugin(BaseContext()), plugin], "authenticate", {"session": Session()})
+        )
+        assert ret == {plugin: True}
@@ -2,7 +2,7 @@ import ssl
 
 import pytest
 
-from amqtt.adapters import ReaderAdapter, WriterAdapter
+from amqtt.adapters import ReaderAdapter, WebSocketsReader, WriterAdapter
 
 
 class BrokenReaderAdapter(ReaderAdapter):
@@ -53,3 +53,26 @@ async def test_abstract_write_raises():
 
     with pytest.raises(NotImplementedError):
         await writer.close()
+
+
+class FakeWebSocket:
+    def __init__(self, messages):
+        self.messages = list(messages)
+        self.recv_count = 0
+
+    async def recv(self):
+        self.recv_count += 1
+        return self.messages.pop(0) if self.messages else None
+
+
+@pytest.mark.asyncio
+async def test_websockets_reader_buffers_messages():
+    protocol = FakeWebSocket([b"\x30\x03\x00", b"\x01a\xc0", "\x00"])
+    reader = WebSocketsReader(protocol)
+    assert await reader.read(1) == b"\x30"
+    assert await reader.read(1) == b"\x03"
+    assert protocol.recv_count == 1
+    assert await reader.read(3) == b"\x00\x01a"
+    assert protocol.recv_count == 2
+    assert await reader.read(2) == b"\xc0\x00"
+    assert await reader.read(1) == b""
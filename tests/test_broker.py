@@ -233,6 +233,27 @@ async def test_client_connect_will_flag(broker):
     await asyncio.sleep(0.1)
 
 
+@pytest.mark.asyncio
+async def test_client_connect_unsupported_protocol_level(broker):
+    conn_reader, conn_writer = await asyncio.open_connection("127.0.0.1", 1883)
+    reader = StreamReaderAdapter(conn_reader)
+    writer = StreamWriterAdapter(conn_writer)
+
+    vh = ConnectVariableHeader()
+    vh.proto_level = 0x03
+    vh.keep_alive = 10
+    vh.clean_session_flag = True
+    payload = ConnectPayload()
+    payload.client_id = "test_id"
+    await ConnectPacket(variable_header=vh, payload=payload).to_stream(writer)
+
+    connack = await ConnackPacket.from_stream(reader)
+    assert connack.return_code == 0x01
+    # the broker closes the connection right after the rejection
+    assert await conn_reader.read() == b""
+    await writer.close()
+
+
 @pytest.mark.asyncio
 async def test_client_connect_clean_session_false(broker):
     client = MQTTClient(client_id="", config={"auto_reconnect": False})
@@ -1,4 +1,5 @@
 import logging
+from pathlib import Path
 from typing import Any
 
 try:
@@ -10,8 +11,9 @@ except ImportError:
         pass
 
 from dacite import from_dict, Config
+import pytest
 
-from amqtt.contexts import BrokerConfig, ListenerType
+from amqtt.contexts import BrokerConfig, ConnectionConfig, ListenerType, TopicConfig, WillConfig
 
 logger = logging.getLogger(__name__)
 
@@ -37,3 +39,28 @@ def test_entrypoint_broker_config(caplog):
     assert broker_config.plugins is None
 
 
+def test_broker_config_plugin_list():
+    broker_config = BrokerConfig(plugins=[
+        "tests.plugins.mocks.TestSimplePlugin",
+        {"tests.plugins.mocks.TestConfigPlugin": {"option1": 1}},
+        {"tests.plugins.mocks.TestSimplePlugin": {"option2": 2}},
+    ])
+
+    assert broker_config.plugins == {
+        "tests.plugins.mocks.TestSimplePlugin": {"option2": 2},
+        "tests.plugins.mocks.TestConfigPlugin": {"option1": 1},
+    }
+    assert list(broker_config.plugins) == ["tests.plugins.mocks.TestSimplePlugin", "tests.plugins.mocks.TestConfigPlugin"]
+
+
+@pytest.mark.parametrize("config_class", [TopicConfig, WillConfig])
+def test_qos_config_validated(config_class):
+    kwargs: dict[str, Any] = {"topic": "a/b", "message": "bye"} if config_class is WillConfig else {}
+    with pytest.raises(ValueError, match="QoS must be 0, 1 or 2"):
+        config_class(qos=3, **kwargs)
+
+
+def test_connection_config_validated():
+    with pytest.raises(ValueError, match="both are required"):
+        ConnectionConfig(certfile="client.crt")
+    assert ConnectionConfig(cafile="ca.pem").cafile == Path("ca.pem")
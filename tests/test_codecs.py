@@ -1,13 +1,20 @@
 import asyncio
 import unittest
 
+import pytest
+
 from amqtt.adapters import StreamReaderAdapter
 from amqtt.codecs_amqtt import (
     bytes_to_hex_str,
     bytes_to_int,
+    decode_packet_id,
     decode_string,
+    decode_string_from,
     encode_string,
+    encode_string_into,
+    int_to_bytes,
 )
+from amqtt.errors import NoDataError
 
 
 class TestCodecs(unittest.TestCase):
@@ -30,6 +37,33 @@ class TestCodecs(unittest.TestCase):
         ret = self.loop.run_until_complete(decode_string(StreamReaderAdapter(stream)))
         assert ret == "AA"
 
+    def test_decode_packet_id(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b"\xff\x01")
+        ret = self.loop.run_until_complete(decode_packet_id(StreamReaderAdapter(stream)))
+        assert ret == 0xFF01
+
+    def test_decode_string_from(self):
+        ret, offset = decode_string_from(b"\x01\x00\x02AA\x00", 1)
+        assert ret == "AA"
+        assert offset == 5
+
+    def test_decode_string_from_truncated(self):
+        with pytest.raises(NoDataError):
+            decode_string_from(b"\x00\x03AA")
+
     def test_encode_string(self):
         encoded = encode_string("AA")
         assert encoded == b"\x00\x02AA"
+
+    def test_encode_string_into(self):
+        buffer = bytearray(b"\x01")
+        encode_string_into(buffer, "AA")
+        encode_string_into(buffer, "")
+        assert buffer == b"\x01\x00\x02AA\x00\x00"
+
+    def test_int_to_bytes(self):
+        assert int_to_bytes(0x7F, 1) == b"\x7f"
+        assert int_to_bytes(0xFF01, 2) == b"\xff\x01"
+        with pytest.raises(ValueError):
+            int_to_bytes(1, 4)
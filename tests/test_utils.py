@@ -31,6 +31,16 @@ def test_client_id():
     client_id = utils.gen_client_id()
     assert isinstance(client_id, str)
     assert client_id.startswith("amqtt/")
+    suffix = client_id.removeprefix("amqtt/")
+    assert len(suffix) == 16
+    assert suffix.isascii() and suffix.isalnum()
+    assert utils.gen_client_id() != client_id
+
+
+def test_parse_extra_headers():
+    assert utils.parse_extra_headers('{"X-Auth": "token"}') == {"X-Auth": "token"}
+    assert utils.parse_extra_headers(None) == {}
+    assert utils.parse_extra_headers("not json") == {}
 
 
 def test_read_yaml_config(tmpdir):